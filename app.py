@@ -10,26 +10,72 @@ Architecture:
 5. Retour de la traduction ou erreur
 """
 
-import uuid
+import asyncio
+import itertools
+import json
+import os
+import threading
 import time
-from typing import Optional, List
-from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional, List, Literal
+from contextlib import asynccontextmanager, suppress
+
+# Cache partagé du modèle entre workers uvicorn (optionnel): les workers
+# suivants mappent les poids depuis la mémoire partagée au lieu de les
+# recharger. Doit être activé AVANT l'import de torch/transformers.
+try:
+    import overmind.api
+    overmind.api.monkey_patch_all()
+except ImportError:
+    pass
 
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
+from cachetools import LRUCache, cached
 import torch
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM, pipeline
+from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 import logging
 
+try:
+    import ctranslate2
+except ImportError:  # Backend optionnel
+    ctranslate2 = None
+
+try:
+    import intel_extension_for_pytorch as ipex
+except ImportError:  # Optimisations CPU optionnelles (Intel)
+    ipex = None
+
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+except ImportError:  # Backend optionnel (CPU)
+    ORTModelForSeq2SeqLM = None
+
 from config import (
     MODEL_NAME,
+    CT2_MODEL_PATH,
+    ONNX_MODEL_PATH,
+    GPU_LOAD_IN_8BIT,
+    TORCH_COMPILE,
+    TORCHINDUCTOR_CACHE_DIR,
     LANG_WOLOF,
     LANG_FRENCH,
     MAX_LENGTH,
+    MAX_NEW_TOKENS_RATIO,
+    MAX_NEW_TOKENS_MARGIN,
     NUM_BEAMS,
+    NUM_BEAMS_SHORT_INPUT,
+    SHORT_INPUT_MAX_TOKENS,
     NO_REPEAT_NGRAM_SIZE,
+    BATCH_MAX_SIZE,
+    BATCH_MAX_WAIT_MS,
+    TRANSLATION_CACHE_SIZE,
+    TOKENIZATION_CACHE_SIZE,
     API_TITLE,
     API_VERSION,
     API_DESCRIPTION,
@@ -41,7 +87,7 @@ from safety import (
     detect_code_injection_attempt,
     calculate_text_similarity
 )
-from monitoring import setup_logging, get_monitor
+from monitoring import setup_logging, get_monitor, stop_logging
 
 # INITIALISATION DU LOGGING
 setup_logging()
@@ -58,28 +104,27 @@ class TranslationRequest(BaseModel):
         min_length=1,
         max_length=MAX_INPUT_LENGTH
     )
-    source_lang: str = Field(
+    # Langues validées directement par pydantic-core (type Literal)
+    source_lang: Literal[LANG_WOLOF, LANG_FRENCH] = Field(
         ...,
         description="Langue source (wol_Latn ou fra_Latn)"
     )
-    target_lang: str = Field(
+    target_lang: Literal[LANG_WOLOF, LANG_FRENCH] = Field(
         ...,
         description="Langue cible (wol_Latn ou fra_Latn)"
     )
     
-    @validator('source_lang', 'target_lang')
-    def validate_language(cls, v):
-        """Valider que les langues sont supportées"""
-        if v not in [LANG_WOLOF, LANG_FRENCH]:
-            raise ValueError(
-                f"Langue non supportée: {v}. "
-                f"Langues acceptées: {LANG_WOLOF}, {LANG_FRENCH}"
-            )
-        return v
-    
-    @validator('text')
-    def validate_text(cls, v):
+    @field_validator('text')
+    @classmethod
+    def validate_text(cls, v: str) -> str:
         """Valider le texte d'entrée"""
+        # Texte non encodable en UTF-8 (surrogate isolé, ex: "\ud800" en JSON)
+        if not v.isascii():
+            try:
+                v.encode('utf-8')
+            except UnicodeEncodeError:
+                raise ValueError("Le texte contient des caractères Unicode invalides")
+        
         # Détection d'injection
         if detect_code_injection_attempt(v):
             raise ValueError("Tentative d'injection de code détectée")
@@ -123,10 +168,336 @@ class HealthResponse(BaseModel):
 
 # VARIABLES GLOBALES (État du service)
 model = None
-tokenizer = None
-translator = None
+tokenizer = None  # Tokenizer de référence (padding, décodage)
+tokenizers: dict = {}  # Un tokenizer par langue source (src_lang figé)
+ct2_translator = None
 safety_checker = None
 device = None
+forced_bos_token_ids: dict = {}
+cpu_bf16 = False  # Modèle optimisé IPEX en bfloat16 (CPU)
+
+# Sérialise l'accès au modèle (allocateur GPU, moteur d'inférence), et
+# seulement à lui: tokenisation et décodage se font en dehors
+inference_lock = threading.Lock()
+# Les tokenizers Rust ne supportent pas les appels concurrents (encode
+# modifie la troncature): verrou distinct, tenu brièvement
+tokenizer_lock = threading.Lock()
+
+# Traductions brutes déjà calculées: (texte, source, cible) -> traduction
+# Les vérifications de sécurité sont tout de même rejouées à chaque requête
+translation_cache = LRUCache(maxsize=TRANSLATION_CACHE_SIZE)
+translation_queue: Optional[asyncio.Queue] = None
+batch_worker_task: Optional[asyncio.Task] = None
+# Lots en cours d'inférence (attendus à l'arrêt)
+batch_group_tasks: set = set()
+
+# Lots lancés simultanément: un en génération, le suivant en tokenisation
+MAX_INFLIGHT_BATCHES = 2
+
+
+# INFÉRENCE ET MICRO-BATCHING
+
+def _load_model(**kwargs):
+    """
+    Charge le modèle NLLB avec l'attention SDPA de PyTorch si possible.
+    
+    SDPA utilise les kernels fusionnés (Flash / memory-efficient attention),
+    plus rapides sur les lots contenant du padding.
+    
+    Args:
+        **kwargs: Arguments supplémentaires pour from_pretrained
+        
+    Returns:
+        Modèle chargé
+    """
+    try:
+        return AutoModelForSeq2SeqLM.from_pretrained(
+            MODEL_NAME,
+            attn_implementation="sdpa",
+            **kwargs
+        )
+    except (ValueError, TypeError) as e:
+        # ImportError non interceptée: installation incomplète (accelerate,
+        # bitsandbytes...), pas une absence de support SDPA
+        logger.warning(f"Attention SDPA non supportée ({e}), implémentation par défaut")
+        return AutoModelForSeq2SeqLM.from_pretrained(MODEL_NAME, **kwargs)
+
+
+def _resolve_forced_bos(lang: str) -> Optional[int]:
+    """
+    Résout l'identifiant du token de langue cible pour le tokenizer NLLB.
+    
+    Essaie différentes méthodes selon la version de transformers.
+    
+    Args:
+        lang: Code de langue NLLB (ex: "wol_Latn")
+        
+    Returns:
+        Identifiant du token, ou None si introuvable
+    """
+    forced_bos_token_id = None
+    
+    if hasattr(tokenizer, 'lang_code_to_id'):
+        try:
+            forced_bos_token_id = tokenizer.lang_code_to_id[lang]
+            logger.debug(f"{lang} via lang_code_to_id: {forced_bos_token_id}")
+        except Exception as e:
+            logger.warning(f"lang_code_to_id échoué pour {lang}: {e}")
+    
+    if forced_bos_token_id is None and hasattr(tokenizer, 'lang_token_to_id'):
+        try:
+            forced_bos_token_id = tokenizer.lang_token_to_id[lang]
+            logger.debug(f"{lang} via lang_token_to_id: {forced_bos_token_id}")
+        except Exception as e:
+            logger.warning(f"lang_token_to_id échoué pour {lang}: {e}")
+    
+    if forced_bos_token_id is None:
+        try:
+            forced_bos_token_id = tokenizer.convert_tokens_to_ids(lang)
+            logger.debug(f"{lang} via convert_tokens_to_ids: {forced_bos_token_id}")
+        except Exception as e:
+            logger.warning(f"convert_tokens_to_ids échoué pour {lang}: {e}")
+    
+    if forced_bos_token_id is None:
+        logger.warning(
+            f"Impossible de déterminer forced_bos_token_id pour {lang}. "
+            f"La traduction se fera sans forcer la langue cible."
+        )
+    
+    return forced_bos_token_id
+
+
+def _run_batch_inference(
+    texts: List[str],
+    source_lang: str,
+    target_lang: str
+) -> List[str]:
+    """
+    Traduit un lot de textes partageant la même paire de langues.
+    
+    Un seul appel au modèle (generate ou translate_batch) pour tout le lot,
+    afin d'amortir le coût fixe de la beam search sur plusieurs requêtes.
+    
+    Fonction bloquante: à exécuter hors de la boucle asyncio. Seul l'appel
+    au modèle est pris sous inference_lock: la tokenisation d'un lot et le
+    décodage d'un autre se font pendant la génération en cours.
+    
+    Args:
+        texts: Textes à traduire (texte original, pas masqué)
+        source_lang: Langue source commune au lot
+        target_lang: Langue cible commune au lot
+        
+    Returns:
+        Traductions brutes, dans le même ordre que texts
+    """
+    with tokenizer_lock:
+        input_ids = [_encode(text, source_lang) for text in texts]
+    
+    max_input_tokens = max(len(ids) for ids in input_ids)
+    
+    # Moins de faisceaux pour les lots d'entrées courtes
+    num_beams = (
+        NUM_BEAMS_SHORT_INPUT
+        if max_input_tokens < SHORT_INPUT_MAX_TOKENS
+        else NUM_BEAMS
+    )
+    
+    # Nombre de pas de décodage borné par la longueur de l'entrée
+    max_new_tokens = min(
+        MAX_LENGTH,
+        int(max_input_tokens * MAX_NEW_TOKENS_RATIO) + MAX_NEW_TOKENS_MARGIN
+    )
+    
+    if ct2_translator is not None:
+        # Backend CTranslate2: la langue cible est imposée via target_prefix
+        with tokenizer_lock:
+            source_tokens = [tokenizer.convert_ids_to_tokens(ids) for ids in input_ids]
+        with inference_lock:
+            results = ct2_translator.translate_batch(
+                source_tokens,
+                target_prefix=[[target_lang]] * len(texts),
+                beam_size=num_beams,
+                max_decoding_length=max_new_tokens,
+                no_repeat_ngram_size=NO_REPEAT_NGRAM_SIZE
+            )
+        with tokenizer_lock:
+            return tokenizer.batch_decode(
+                [tokenizer.convert_tokens_to_ids(result.hypotheses[0]) for result in results],
+                skip_special_tokens=True
+            )
+    
+    # Préparer les textes pour le modèle NLLB (padding au plus long du lot)
+    with tokenizer_lock:
+        inputs = tokenizer.pad(
+            {"input_ids": [list(ids) for ids in input_ids]},
+            return_tensors="pt"
+        )
+    
+    # Déplacer sur le bon device (copie asynchrone depuis la mémoire épinglée)
+    if device == "cuda":
+        inputs = {
+            k: v.pin_memory().to(device, non_blocking=True)
+            for k, v in inputs.items()
+        }
+    else:
+        inputs = {k: v.to(device) for k, v in inputs.items()}
+    
+    # Traduction (autocast FP16 sur GPU, BF16 sur CPU si optimisé par IPEX)
+    with inference_lock, torch.inference_mode(), torch.autocast(
+        device_type=device,
+        dtype=torch.float16 if device == "cuda" else torch.bfloat16,
+        enabled=(device == "cuda" or cpu_bf16)
+    ):
+        # Forcer la langue cible (résolu une fois au démarrage)
+        forced_bos_token_id = forced_bos_token_ids.get(target_lang)
+        
+        # Générer les traductions du lot
+        translated_tokens = model.generate(
+            **inputs,
+            forced_bos_token_id=forced_bos_token_id,
+            max_new_tokens=max_new_tokens,
+            num_beams=num_beams,
+            no_repeat_ngram_size=NO_REPEAT_NGRAM_SIZE,
+            early_stopping=True
+        )
+    
+    # Décoder les traductions (chemin batché du tokenizer Rust)
+    with tokenizer_lock:
+        return tokenizer.batch_decode(translated_tokens, skip_special_tokens=True)
+
+
+@cached(LRUCache(maxsize=TOKENIZATION_CACHE_SIZE), lock=threading.Lock())
+def _encode(text: str, source_lang: str) -> tuple:
+    """
+    Tokenise un texte (avec cache LRU pour éviter les passes SentencePiece
+    répétées sur les phrases fréquentes).
+    
+    Args:
+        text: Texte à tokeniser
+        source_lang: Langue source (détermine le token de langue NLLB)
+        
+    Returns:
+        Identifiants de tokens (tronqués à MAX_LENGTH)
+    """
+    return tuple(
+        tokenizers[source_lang].encode(text, truncation=True, max_length=MAX_LENGTH)
+    )
+
+
+async def _batch_worker() -> None:
+    """
+    Tâche de fond qui regroupe les requêtes arrivant dans une courte fenêtre.
+    
+    Attend au plus BATCH_MAX_WAIT_MS (ou BATCH_MAX_SIZE requêtes), puis lance
+    une inférence par paire (source_lang, target_lang) présente dans le lot.
+    Au plus MAX_INFLIGHT_BATCHES lots sont en cours à la fois, pour que la
+    tokenisation du suivant recouvre la génération du précédent.
+    
+    Annulée à l'arrêt: les requêtes déjà retirées de la file mais pas encore
+    lancées reçoivent alors une erreur.
+    """
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(MAX_INFLIGHT_BATCHES)
+    batch = []
+    pending_groups = []
+    
+    try:
+        while True:
+            batch = [await translation_queue.get()]
+            deadline = loop.time() + BATCH_MAX_WAIT_MS / 1000
+            
+            while len(batch) < BATCH_MAX_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(translation_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Grouper par paire de langues (src_lang et langue forcée uniformes)
+            groups = {}
+            for text, source_lang, target_lang, future in batch:
+                groups.setdefault((source_lang, target_lang), []).append((text, future))
+            pending_groups = list(groups.items())
+            batch = []
+            
+            while pending_groups:
+                (source_lang, target_lang), items = pending_groups[0]
+                logger.debug(
+                    f"Lot de {len(items)} requête(s) {source_lang}→{target_lang}"
+                )
+                await slots.acquire()
+                pending_groups.pop(0)
+                task = asyncio.create_task(
+                    _run_batch_group(items, source_lang, target_lang, slots)
+                )
+                batch_group_tasks.add(task)
+                task.add_done_callback(batch_group_tasks.discard)
+    except asyncio.CancelledError:
+        _fail_pending(
+            [future for *_, future in batch]
+            + [future for _, items in pending_groups for _, future in items]
+        )
+        raise
+
+
+def _fail_pending(futures: list) -> None:
+    """
+    Fait échouer les requêtes en attente lors de l'arrêt du service.
+    
+    Args:
+        futures: Futures des requêtes non traitées
+    """
+    for future in futures:
+        if not future.done():
+            future.set_exception(RuntimeError("Service en cours d'arrêt"))
+
+
+async def _run_batch_group(
+    items: list,
+    source_lang: str,
+    target_lang: str,
+    slots: asyncio.Semaphore
+) -> None:
+    """
+    Exécute un lot (une paire de langues) et résout les futures associées.
+    
+    Args:
+        items: Couples (texte, future) du lot
+        source_lang: Langue source commune au lot
+        target_lang: Langue cible commune au lot
+        slots: Sémaphore des lots en cours, libéré à la fin
+    """
+    try:
+        # Inférence dans le threadpool: la boucle reste libre pour
+        # /health, /statistics et la constitution du lot suivant
+        outputs = await run_in_threadpool(
+            _run_batch_inference,
+            [text for text, _ in items],
+            source_lang,
+            target_lang
+        )
+    except Exception as e:
+        for _, future in items:
+            if not future.done():
+                future.set_exception(e)
+        return
+    finally:
+        slots.release()
+    
+    for (_, future), output in zip(items, outputs):
+        if not future.done():
+            future.set_result(output)
+
+
+async def _submit_translation(text: str, source_lang: str, target_lang: str) -> str:
+    """
+    Place un texte dans la file de micro-batching et attend sa traduction brute.
+    """
+    future = asyncio.get_running_loop().create_future()
+    await translation_queue.put((text, source_lang, target_lang, future))
+    return await future
 
 
 @asynccontextmanager
@@ -137,7 +508,9 @@ async def lifespan(app: FastAPI):
     # STARTUP
     logger.info("Initialisation du service de traduction...")
     
-    global model, tokenizer, translator, safety_checker, device
+    global model, tokenizer, tokenizers, ct2_translator, safety_checker, device
+    global forced_bos_token_ids, cpu_bf16
+    global translation_queue, batch_worker_task
     
     try:
         # Détection du device
@@ -148,31 +521,95 @@ async def lifespan(app: FastAPI):
             logger.info(f"GPU: {torch.cuda.get_device_name(0)}")
             logger.info(f"VRAM disponible: {torch.cuda.get_device_properties(0).total_memory / 1e9:.2f} GB")
         
-        # Chargement du tokenizer
+        # Chargement des tokenizers (un par langue source, pas de mutation
+        # de src_lang à chaque requête)
         logger.info(f"Chargement du tokenizer: {MODEL_NAME}")
-        tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-        logger.info("Tokenizer chargé")
-        
-        # Chargement du modèle
-        logger.info(f"Chargement du modèle: {MODEL_NAME}")
-        model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_NAME)
-        model.to(device)
-        model.eval()  # Mode évaluation (pas d'entraînement)
-        logger.info("Modèle chargé et prêt")
-        
-        # Création du pipeline de traduction
-        translator = pipeline(
-            "translation",
-            model=model,
-            tokenizer=tokenizer,
-            device=0 if device == "cuda" else -1
-        )
-        logger.info("Pipeline de traduction créé")
+        tokenizers = {
+            lang: AutoTokenizer.from_pretrained(MODEL_NAME, src_lang=lang, use_fast=True)
+            for lang in (LANG_WOLOF, LANG_FRENCH)
+        }
+        tokenizer = tokenizers[LANG_FRENCH]
+        logger.info("Tokenizers chargés")
+        
+        # Tokens de langue cible (2 valeurs possibles, calculées une seule fois)
+        forced_bos_token_ids = {
+            lang: _resolve_forced_bos(lang)
+            for lang in (LANG_WOLOF, LANG_FRENCH)
+        }
+        logger.info(f"Tokens de langue cible: {forced_bos_token_ids}")
+        
+        if ctranslate2 is not None and Path(CT2_MODEL_PATH).is_dir():
+            # Backend CTranslate2: beam search exécuté dans le moteur C++
+            logger.info(f"Chargement du modèle CTranslate2: {CT2_MODEL_PATH}")
+            ct2_translator = ctranslate2.Translator(
+                CT2_MODEL_PATH,
+                device=device,
+                compute_type="float16" if device == "cuda" else "int8"
+            )
+            logger.info("Modèle CTranslate2 chargé et prêt")
+        elif (
+            device == "cpu"
+            and ORTModelForSeq2SeqLM is not None
+            and Path(ONNX_MODEL_PATH).is_dir()
+        ):
+            # Backend ONNX Runtime INT8: même API generate() que transformers
+            logger.info(f"Chargement du modèle ONNX INT8: {ONNX_MODEL_PATH}")
+            model = ORTModelForSeq2SeqLM.from_pretrained(ONNX_MODEL_PATH)
+            logger.info("Modèle ONNX Runtime chargé et prêt")
+        else:
+            # Chargement du modèle
+            load_in_8bit = device == "cuda" and GPU_LOAD_IN_8BIT
+            logger.info(f"Chargement du modèle: {MODEL_NAME} (INT8: {load_in_8bit})")
+            
+            if load_in_8bit:
+                # bitsandbytes place lui-même les poids sur le GPU (pas de .to())
+                model = _load_model(load_in_8bit=True, device_map="auto")
+            else:
+                # FP16 sur GPU (tensor cores, 2x moins de VRAM), FP32 sur CPU
+                model = _load_model(
+                    torch_dtype=torch.float16 if device == "cuda" else torch.float32
+                )
+                model.to(device)
+            model.eval()  # Mode évaluation (pas d'entraînement)
+            logger.info("Modèle chargé et prêt")
+            
+            if device == "cpu" and ipex is not None:
+                # Fusion des motifs Linear+Add, Add+LayerNorm, attention (Xeon)
+                model = ipex.optimize(model, dtype=torch.bfloat16, inplace=True)
+                cpu_bf16 = True
+                logger.info("Modèle optimisé avec IPEX (bfloat16)")
+            
+            if device == "cuda" and TORCH_COMPILE and not load_in_8bit:
+                # Compiler le forward: generate() l'appelle à chaque pas de décodage
+                os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", TORCHINDUCTOR_CACHE_DIR)
+                model.forward = torch.compile(
+                    model.forward,
+                    mode="reduce-overhead",
+                    fullgraph=False
+                )
+                logger.info("Modèle compilé avec torch.compile (reduce-overhead)")
         
         # Initialisation du safety checker
         safety_checker = MedicalSafetyChecker()
         logger.info("Safety checker initialisé")
         
+        # Démarrage du micro-batching
+        translation_queue = asyncio.Queue()
+        batch_worker_task = asyncio.create_task(_batch_worker())
+        logger.info(
+            f"Micro-batching actif (max {BATCH_MAX_SIZE} requêtes, "
+            f"{BATCH_MAX_WAIT_MS}ms)"
+        )
+        
+        # Warmup: allocateur CUDA et autotuning des kernels payés avant la
+        # première requête utilisateur (avec TORCH_COMPILE, seules ces formes
+        # sont compilées d'avance)
+        logger.info("Warmup du modèle...")
+        warmup_start = time.time()
+        _run_batch_inference(["Bonjour"], LANG_FRENCH, LANG_WOLOF)
+        _run_batch_inference(["Na nga def"], LANG_WOLOF, LANG_FRENCH)
+        logger.info(f"Warmup terminé en {(time.time() - warmup_start) * 1000:.0f}ms")
+        
         # Log du démarrage
         monitor = get_monitor()
         monitor.log_startup(MODEL_NAME, device)
@@ -187,17 +624,33 @@ async def lifespan(app: FastAPI):
     
     # SHUTDOWN
     logger.info("Arrêt du service...")
+    if batch_worker_task is not None:
+        batch_worker_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await batch_worker_task
+        
+        # Laisser finir les lots déjà lancés (threads non annulables) avant
+        # de libérer le modèle, puis refuser ceux restés dans la file
+        await asyncio.gather(*batch_group_tasks, return_exceptions=True)
+        _fail_pending([
+            translation_queue.get_nowait()[3]
+            for _ in range(translation_queue.qsize())
+        ])
+    
     monitor = get_monitor()
     monitor.log_shutdown()
     
     # Libération de la mémoire GPU
-    if device == "cuda" and model is not None:
+    if device == "cuda" and (model is not None or ct2_translator is not None):
         del model
-        del translator
+        del ct2_translator
         torch.cuda.empty_cache()
         logger.info("🧹 Mémoire GPU libérée")
     
     logger.info("Service arrêté proprement")
+    
+    # En dernier: vide la file de logs vers le fichier d'audit
+    stop_logging()
 
 
 # CRÉATION DE L'APPLICATION FASTAPI
@@ -221,6 +674,12 @@ app.add_middleware(
 
 # MIDDLEWARE DE LOGGING DES REQUÊTES
 
+# Identifiants de requête: PID + compteur monotone (corrélation des logs
+# uniquement, pas besoin d'un UUID aléatoire). Le PID est lu à chaque
+# requête: lu à l'import, il serait celui du parent pour tous les workers
+# d'un serveur pre-fork (gunicorn --preload)
+_REQUEST_SEQ = itertools.count()
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """
@@ -229,7 +688,7 @@ async def log_requests(request: Request, call_next):
     start_time = time.time()
     
     # Générer un ID unique pour cette requête
-    request_id = str(uuid.uuid4())
+    request_id = f"{os.getpid()}-{next(_REQUEST_SEQ):x}"
     request.state.request_id = request_id
     
     # Logger la requête entrante
@@ -282,10 +741,11 @@ async def health_check():
     Utile pour les orchestrateurs (Docker Swarm)
     """
     monitor = get_monitor()
+    model_loaded = model is not None or ct2_translator is not None
     
     return HealthResponse(
-        status="healthy" if model is not None else "unhealthy",
-        model_loaded=model is not None,
+        status="healthy" if model_loaded else "unhealthy",
+        model_loaded=model_loaded,
         device=device or "unknown",
         statistics=monitor.get_statistics()
     )
@@ -297,7 +757,7 @@ async def get_statistics():
     Récupérer les statistiques d'utilisation du service.
     """
     monitor = get_monitor()
-    return monitor.get_statistics()
+    return monitor.get_statistics(include_percentiles=True)
 
 
 @app.post(
@@ -332,7 +792,7 @@ async def translate(
     
     try:
         # Vérifier que le service est prêt
-        if model is None or tokenizer is None or safety_checker is None:
+        if (model is None and ct2_translator is None) or tokenizer is None or safety_checker is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Service de traduction non initialisé"
@@ -348,69 +808,18 @@ async def translate(
         # ÉTAPE 1: TRADUCTION DIRECTE (sans masquage)
         logger.debug(f"[{request_id}] Début de la traduction...")
         
-        # Définir la langue source pour le tokenizer NLLB
-        tokenizer.src_lang = request.source_lang
-        
-        # Préparer le texte pour le modèle NLLB (TEXTE ORIGINAL, pas masqué)
-        inputs = tokenizer(
-            request.text,  # <- CHANGEMENT: on traduit le texte original
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=MAX_LENGTH
-        )
-        
-        # Déplacer sur le bon device
-        inputs = {k: v.to(device) for k, v in inputs.items()}
+        cache_key = (request.text, request.source_lang, request.target_lang)
+        translated_text_raw = translation_cache.get(cache_key)
         
-        # Traduction
-        with torch.no_grad():
-            # Forcer la langue cible
-            forced_bos_token_id = None
-            
-            # Essayer différentes méthodes selon la version
-            if hasattr(tokenizer, 'lang_code_to_id'):
-                try:
-                    forced_bos_token_id = tokenizer.lang_code_to_id[request.target_lang]
-                    logger.debug(f"[{request_id}] Langue cible via lang_code_to_id: {forced_bos_token_id}")
-                except Exception as e:
-                    logger.warning(f"[{request_id}] lang_code_to_id échoué: {e}")
-            
-            if forced_bos_token_id is None and hasattr(tokenizer, 'lang_token_to_id'):
-                try:
-                    forced_bos_token_id = tokenizer.lang_token_to_id[request.target_lang]
-                    logger.debug(f"[{request_id}] Langue cible via lang_token_to_id: {forced_bos_token_id}")
-                except Exception as e:
-                    logger.warning(f"[{request_id}] lang_token_to_id échoué: {e}")
-            
-            if forced_bos_token_id is None:
-                try:
-                    forced_bos_token_id = tokenizer.convert_tokens_to_ids(request.target_lang)
-                    logger.debug(f"[{request_id}] Langue cible via convert_tokens_to_ids: {forced_bos_token_id}")
-                except Exception as e:
-                    logger.warning(f"[{request_id}] convert_tokens_to_ids échoué: {e}")
-            
-            if forced_bos_token_id is None:
-                logger.warning(
-                    f"[{request_id}] Impossible de déterminer forced_bos_token_id. "
-                    f"La traduction se fera sans forcer la langue cible."
-                )
-            
-            # Générer la traduction
-            translated_tokens = model.generate(
-                **inputs,
-                forced_bos_token_id=forced_bos_token_id,
-                max_length=MAX_LENGTH,
-                num_beams=NUM_BEAMS,
-                no_repeat_ngram_size=NO_REPEAT_NGRAM_SIZE,
-                early_stopping=True
+        if translated_text_raw is None:
+            translated_text_raw = await _submit_translation(
+                request.text,
+                request.source_lang,
+                request.target_lang
             )
-        
-        # Décoder la traduction
-        translated_text_raw = tokenizer.decode(
-            translated_tokens[0],
-            skip_special_tokens=True
-        )
+            translation_cache[cache_key] = translated_text_raw
+        else:
+            logger.debug(f"[{request_id}] Traduction brute trouvée dans le cache")
         
         logger.debug(f"[{request_id}] Traduction brute: {translated_text_raw[:100]}...")
         
@@ -535,6 +944,22 @@ async def translate(
 
 # EXCEPTION HANDLERS
 
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """
+    Erreurs de validation (422), au format du handler par défaut de FastAPI.
+    
+    Sérialisé en ASCII: l'entrée renvoyée dans le détail peut contenir un
+    surrogate isolé (ex: "\\ud800"), que JSONResponse ne sait pas encoder.
+    """
+    content = {"detail": jsonable_encoder(exc.errors())}
+    return Response(
+        content=json.dumps(content, ensure_ascii=True),
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        media_type="application/json"
+    )
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """
@@ -4,6 +4,7 @@ Projet: Assistant Médical YAMA - Pipeline NMT
 """
 
 import os
+import re
 from typing import Final
 
 # CONFIGURATION MODÈLE HUGGING FACE
@@ -17,15 +18,66 @@ LANG_FRENCH: Final[str] = "fra_Latn"
 # Chemin vers le fichier JSON contenant les médicaments
 MEDICATION_DATABASE_PATH: Final[str] = "medications_database.json"
 
+# BACKEND D'INFÉRENCE CTRANSLATE2 (OPTIONNEL)
+# Si ce dossier existe et que ctranslate2 est installé, la génération passe
+# par le moteur C++ CTranslate2 au lieu de la boucle generate de transformers.
+# Conversion (une seule fois, hors ligne):
+#   ct2-transformers-converter --model bilalfaye/nllb-200-distilled-600M-wo-fr-en \
+#       --quantization float16 --output_dir ./nllb-ct2
+CT2_MODEL_PATH: Final[str] = os.getenv("CT2_MODEL_PATH", "nllb-ct2")
+
+# BACKEND ONNX RUNTIME INT8 POUR CPU (OPTIONNEL)
+# Modèle exporté en ONNX et quantifié dynamiquement en INT8 (instructions
+# VNNI). Utilisé uniquement sur CPU, si le dossier existe.
+# Conversion (une seule fois, hors ligne): python3 convert_onnx.py
+ONNX_MODEL_PATH: Final[str] = os.getenv("ONNX_MODEL_PATH", "nllb-onnx-int8")
+
 # CONFIGURATION GPU/CPU
 # Le modèle détectera automatiquement CUDA si disponible
 DEVICE: Final[str] = "auto"  # "cuda" si GPU disponible, sinon "cpu"
 
+# Chargement INT8 (bitsandbytes, LLM.int8) sur GPU, sur demande: ~2x moins
+# de VRAM que FP16, mais généralement plus lent pour un modèle de 600M
+# paramètres, et désactive torch.compile. Par défaut: FP16.
+# Ignoré sur CPU (le modèle reste en FP32)
+GPU_LOAD_IN_8BIT: Final[bool] = os.getenv("GPU_LOAD_IN_8BIT", "false").lower() == "true"
+
+# Compilation torch.compile sur GPU (fusion d'opérateurs + CUDA graphs),
+# expérimentale et sur demande: le cache KV de generate() grandit à chaque
+# pas et les lots varient en taille et en longueur, donc chaque nouvelle
+# forme recompile et réenregistre un CUDA graph (pics de latence, mémoire).
+# Ignorée en INT8 et sur CPU
+TORCH_COMPILE: Final[bool] = os.getenv("TORCH_COMPILE", "false").lower() == "true"
+# Cache de compilation persistant (à monter en volume pour éviter de
+# recompiler à chaque déploiement)
+TORCHINDUCTOR_CACHE_DIR: Final[str] = os.getenv(
+    "TORCHINDUCTOR_CACHE_DIR", "torchinductor_cache"
+)
+
 # PARAMÈTRES DE TRADUCTION
 MAX_LENGTH: Final[int] = 512  # Longueur maximale des tokens
-NUM_BEAMS: Final[int] = 5  # Beam search pour meilleure qualité
+# Plafond de décodage proportionnel à l'entrée:
+# min(MAX_LENGTH, tokens_entrée * RATIO + MARGE)
+MAX_NEW_TOKENS_RATIO: Final[float] = 1.5
+MAX_NEW_TOKENS_MARGIN: Final[int] = 16
+NUM_BEAMS: Final[int] = 5  # Beam search pour meilleure qualité (entrées longues)
+# Entrées courtes (cas le plus fréquent): gain de qualité négligeable au-delà
+# de 2 faisceaux, alors que le coût du décodage croît avec leur nombre
+NUM_BEAMS_SHORT_INPUT: Final[int] = 2
+SHORT_INPUT_MAX_TOKENS: Final[int] = 64
 NO_REPEAT_NGRAM_SIZE: Final[int] = 3  # Éviter répétitions
 
+# MICRO-BATCHING DES REQUÊTES
+# Les requêtes arrivant dans la même fenêtre sont traduites en un seul appel
+BATCH_MAX_SIZE: Final[int] = int(os.getenv("BATCH_MAX_SIZE", "8"))
+BATCH_MAX_WAIT_MS: Final[float] = float(os.getenv("BATCH_MAX_WAIT_MS", "10"))
+
+# CACHES LRU
+# Traductions brutes par (texte, langue source, langue cible)
+TRANSLATION_CACHE_SIZE: Final[int] = int(os.getenv("TRANSLATION_CACHE_SIZE", "4096"))
+# Identifiants de tokens par (texte, langue source)
+TOKENIZATION_CACHE_SIZE: Final[int] = int(os.getenv("TOKENIZATION_CACHE_SIZE", "1024"))
+
 # SEUILS DE SÉCURITÉ MÉDICALE (CRITIQUES)
 
 # Seuil de similarité minimale pour les nombres/posologies
@@ -87,6 +139,14 @@ MEDICAL_VALUES_PATTERNS: Final[list[str]] = [
     r'\b\d+(?:[.,]\d+)?\s*(?:g/dl|mmol/l|UI/l)\b',  # Valeurs bio
 ]
 
+# Versions compilées une seule fois à l'import (partagées par tous les modules)
+DOSAGE_PATTERNS_COMPILED: Final[list[re.Pattern]] = [
+    re.compile(p, re.IGNORECASE) for p in DOSAGE_PATTERNS
+]
+MEDICAL_VALUES_PATTERNS_COMPILED: Final[list[re.Pattern]] = [
+    re.compile(p, re.IGNORECASE) for p in MEDICAL_VALUES_PATTERNS
+]
+
 # CONFIGURATION API
 API_TITLE: Final[str] = "YAMA Medical Translation API"
 API_VERSION: Final[str] = "1.0.0"
@@ -100,6 +160,13 @@ pour le projet Assistant Médical YAMA.
 # LOGGING
 LOG_LEVEL: Final[str] = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE: Final[str] = "medical_translation.log"
+# Rotation du fichier de log (taille max en octets, nombre d'archives)
+LOG_MAX_BYTES: Final[int] = int(os.getenv("LOG_MAX_BYTES", "50000000"))
+LOG_BACKUP_COUNT: Final[int] = int(os.getenv("LOG_BACKUP_COUNT", "10"))
+# Écriture bufferisée: vidage au plus N secondes après un record (WARNING+ immédiat)
+LOG_FLUSH_INTERVAL_S: Final[float] = float(os.getenv("LOG_FLUSH_INTERVAL_S", "1.0"))
+# Nombre de temps de traduction récents conservés pour les percentiles
+STATS_WINDOW_SIZE: Final[int] = int(os.getenv("STATS_WINDOW_SIZE", "10000"))
 
 # LIMITES DE RATE
 MAX_INPUT_LENGTH: Final[int] = 10000  # Caractères max en entrée
@@ -0,0 +1,58 @@
+"""
+Conversion hors ligne du modèle NLLB-200 en ONNX quantifié INT8
+Projet: Assistant Médical YAMA - Pipeline NMT
+
+Le modèle produit est chargé automatiquement par app.py sur CPU
+(voir ONNX_MODEL_PATH dans config.py).
+
+Usage:
+    python3 convert_onnx.py [dossier_sortie]
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+from config import MODEL_NAME, ONNX_MODEL_PATH
+
+
+def convert(output_dir: str = ONNX_MODEL_PATH) -> None:
+    """
+    Exporte le modèle en ONNX puis applique une quantification dynamique INT8.
+    
+    Args:
+        output_dir: Dossier de destination du modèle quantifié
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    
+    # Quantification dynamique (pas de calibration), kernels int8 AVX512-VNNI
+    quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False)
+    
+    with tempfile.TemporaryDirectory() as export_dir:
+        print(f"Export ONNX de {MODEL_NAME}...")
+        onnx_model = ORTModelForSeq2SeqLM.from_pretrained(MODEL_NAME, export=True)
+        onnx_model.save_pretrained(export_dir)
+        
+        for onnx_file in sorted(Path(export_dir).glob("*.onnx")):
+            print(f"Quantification INT8: {onnx_file.name}")
+            quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=onnx_file.name)
+            quantizer.quantize(
+                save_dir=output_path,
+                quantization_config=quantization_config
+            )
+            # Conserver les noms attendus par ORTModelForSeq2SeqLM
+            quantized_file = output_path / f"{onnx_file.stem}_quantized.onnx"
+            quantized_file.replace(output_path / onnx_file.name)
+        
+        onnx_model.config.save_pretrained(output_path)
+        onnx_model.generation_config.save_pretrained(output_path)
+    
+    print(f"Modèle ONNX INT8 sauvegardé dans {output_path}")
+
+
+if __name__ == "__main__":
+    convert(sys.argv[1] if len(sys.argv) > 1 else ONNX_MODEL_PATH)
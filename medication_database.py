@@ -5,13 +5,171 @@ Charge et gère une liste complète de médicaments pour la détection
 
 import re
 import json
+import unicodedata
 from pathlib import Path
-from typing import Set, List
+from typing import Dict, Iterable, Optional, Set, List, Tuple, Union
 import logging
 
+try:
+    import hyperscan
+except ImportError:  # Accélération optionnelle (Hyperscan, SIMD)
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # Accélération optionnelle (pyahocorasick)
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+# NORMALISATION À LONGUEUR CONSTANTE
+# Minuscules sans accents, caractère par caractère: les positions dans le
+# texte normalisé correspondent exactement à celles du texte original.
+
+def _fold_char(char: str) -> str:
+    """Normalise un caractère non-ASCII en un seul caractère (ou le garde)."""
+    lowered = char.lower()
+    if len(lowered) != 1:
+        return char
+    base = ''.join(
+        c for c in unicodedata.normalize('NFKD', lowered)
+        if not unicodedata.combining(c)
+    )
+    return base if len(base) == 1 else lowered
+
+
+def _build_fold_table() -> Dict[int, str]:
+    """
+    Table de normalisation calculée une fois: ASCII majuscule, Latin-1,
+    Latin étendu A/B et additionnel. Les autres caractères (absents des
+    noms de médicaments) restent inchangés: la table ne grossit pas avec
+    les textes reçus.
+    """
+    table = {ord(c): c.lower() for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+    for start, end in ((0x00C0, 0x0250), (0x1E00, 0x1F00)):
+        for code in range(start, end):
+            folded = _fold_char(chr(code))
+            if folded != chr(code):
+                table[code] = folded
+    return table
+
+
+_FOLD_TABLE: Dict[int, str] = _build_fold_table()
+
+
+def _fold(text: str) -> str:
+    """
+    Met un texte en minuscules et retire les accents sans changer sa longueur.
+    
+    Args:
+        text: Texte original
+        
+    Returns:
+        Texte normalisé de même longueur
+    """
+    return text.translate(_FOLD_TABLE)
+
+
+# Accents latins courants → lettre de base (évite NFKD sur les cas usuels)
+_ACCENT_TABLE: Dict[int, str] = str.maketrans({
+    'à': 'a', 'á': 'a', 'â': 'a', 'ã': 'a', 'ä': 'a', 'å': 'a',
+    'ç': 'c',
+    'è': 'e', 'é': 'e', 'ê': 'e', 'ë': 'e',
+    'ì': 'i', 'í': 'i', 'î': 'i', 'ï': 'i',
+    'ñ': 'n',
+    'ò': 'o', 'ó': 'o', 'ô': 'o', 'õ': 'o', 'ö': 'o',
+    'ù': 'u', 'ú': 'u', 'û': 'u', 'ü': 'u',
+    'ý': 'y', 'ÿ': 'y',
+    'À': 'A', 'Á': 'A', 'Â': 'A', 'Ã': 'A', 'Ä': 'A', 'Å': 'A',
+    'Ç': 'C',
+    'È': 'E', 'É': 'E', 'Ê': 'E', 'Ë': 'E',
+    'Ì': 'I', 'Í': 'I', 'Î': 'I', 'Ï': 'I',
+    'Ñ': 'N',
+    'Ò': 'O', 'Ó': 'O', 'Ô': 'O', 'Õ': 'O', 'Ö': 'O',
+    'Ù': 'U', 'Ú': 'U', 'Û': 'U', 'Ü': 'U',
+    'Ý': 'Y',
+})
+
+
+def _is_word_char(char: str) -> bool:
+    """Équivalent de \\w (utilisé pour les frontières de mots)."""
+    return char.isalnum() or char == '_'
+
+
+# REGEX EN TRIE
+# Les médicaments partagent beaucoup de préfixes (AMOX..., PARACET...):
+# une alternance factorisée en trie évite au moteur regex de retester
+# chaque nom depuis le début à chaque position du texte.
+
+def _build_trie(words: List[str]) -> Dict[str, dict]:
+    """
+    Construit un trie de préfixes (dictionnaires imbriqués).
+    La clé '' marque la fin d'un mot.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return trie
+
+
+def _trie_to_regex(
+    node: Dict[str, dict],
+    variants: Dict[Tuple[int, str], str] = None
+) -> str:
+    """
+    Convertit un nœud du trie en regex factorisée.
+
+    Args:
+        node: Nœud du trie
+        variants: Caractères équivalents par arête (id du nœud parent,
+            caractère de base), ex: 'eé' → classe [eé] à cette position
+
+    Returns:
+        Regex correspondant à tous les suffixes du nœud
+    """
+    variants = variants or {}
+
+    def chars(char: str) -> str:
+        return variants.get((id(node), char), char)
+
+    def atom(char: str) -> str:
+        if len(chars(char)) > 1:
+            return '[' + ''.join(re.escape(c) for c in chars(char)) + ']'
+        return re.escape(char)
+
+    leaf_chars = []
+    alternatives = []
+    for char in sorted(c for c in node if c):
+        child = node[char]
+        if list(child) == ['']:
+            leaf_chars.append(char)
+        else:
+            alternatives.append(atom(char) + _trie_to_regex(child, variants))
+
+    # Les branches d'un seul caractère final deviennent une classe [abc]
+    if len(leaf_chars) == 1:
+        alternatives.append(atom(leaf_chars[0]))
+    elif leaf_chars:
+        alternatives.append(
+            '[' + ''.join(re.escape(c) for char in leaf_chars for c in chars(char)) + ']'
+        )
+
+    # Un seul caractère ou une classe peut recevoir '?' sans groupe
+    atomic = len(alternatives) == 1 and bool(leaf_chars)
+    if len(alternatives) == 1 and '' not in node:
+        return alternatives[0]
+
+    body = alternatives[0] if atomic else '(?:' + '|'.join(alternatives) + ')'
+    if '' in node:
+        # Quantificateur gourmand: le suffixe le plus long est essayé d'abord
+        return body + '?'
+    return body
+
+
 class MedicationDatabase:
     """
     Base de données de médicaments pour détection et protection.
@@ -25,14 +183,29 @@ class MedicationDatabase:
         Args:
             medication_file: Chemin vers un fichier JSON contenant les médicaments
         """
-        # Ensemble pour recherche rapide O(1)
-        self.medications: Set[str] = set()
+        # Index unique pour recherche rapide O(1):
+        # clé de recherche (minuscules, avec/sans accents) → nom canonique
+        self._lookup: Dict[str, str] = {}
         
-        # Noms normalisés (minuscules, sans accents)
-        self.normalized_medications: Set[str] = set()
+        # Pattern regex compilé (généré à la première utilisation)
+        self._medication_pattern = None
         
-        # Pattern regex compilé (sera généré dynamiquement)
-        self.medication_pattern = None
+        # Base Hyperscan (si installé), sinon automate Aho-Corasick
+        # (si pyahocorasick est installé)
+        self._hs_db = None
+        self._automaton = None
+        
+        # Pattern sans IGNORECASE appliqué au texte normalisé (repli)
+        self._folded_pattern = None
+        
+        # Même pattern en bytes pour les textes ASCII reçus en bytes
+        # (compilé à la première utilisation)
+        self._bytes_pattern = None
+        
+        # Recompilation paresseuse: les ajouts marquent les patterns comme
+        # périmés, recompilés une seule fois à la prochaine recherche
+        self._dirty = True
+        self._compiled_count = -1
         
         # Charger les médicaments par défaut
         self._load_default_medications()
@@ -41,11 +214,20 @@ class MedicationDatabase:
         if medication_file and Path(medication_file).exists():
             self.load_from_file(medication_file)
         
-        # Compiler le pattern regex
-        self._compile_pattern()
-        
         logger.info(f"Base de données médicamenteuse chargée: {len(self.medications)} médicaments")
     
+    @property
+    def medications(self) -> Set[str]:
+        """Noms canoniques des médicaments (une orthographe par nom, à la casse près)."""
+        return set(self._lookup.values())
+    
+    @property
+    def medication_pattern(self):
+        """Pattern regex (IGNORECASE) de tous les médicaments, compilé à la demande."""
+        if self._dirty:
+            self._compile_pattern()
+        return self._medication_pattern
+    
     def _load_default_medications(self):
         """
         Charge une liste par défaut de médicaments courants.
@@ -132,18 +314,32 @@ class MedicationDatabase:
         Args:
             medication: Nom du médicament
         """
-        # Ajouter le nom original
-        self.medications.add(medication)
-        
-        # Ajouter la version normalisée (minuscules)
         normalized = medication.lower()
-        self.normalized_medications.add(normalized)
+        
+        # Déjà connu (à la casse près): la première orthographe fait foi
+        known = self._lookup.get(normalized)
+        if known is not None and known.lower() == normalized:
+            return
+        
+        # Version normalisée (minuscules), prioritaire sur une variante
+        # sans accents d'un autre nom
+        self._lookup[normalized] = medication
+        self._dirty = True
         
         # Variations courantes (avec/sans accents)
         # Exemple: métronidazole → metronidazole
-        normalized_no_accent = self._remove_accents(medication.lower())
-        if normalized_no_accent != normalized:
-            self.normalized_medications.add(normalized_no_accent)
+        self._lookup.setdefault(self._remove_accents(normalized), medication)
+        self._lookup.setdefault(_fold(medication), medication)
+    
+    def bulk_add(self, medications: Iterable[str]):
+        """
+        Ajoute plusieurs médicaments (une seule recompilation, différée).
+        
+        Args:
+            medications: Noms des médicaments
+        """
+        for medication in medications:
+            self.add_medication(medication)
     
     def load_from_file(self, filepath: str):
         """
@@ -188,7 +384,7 @@ class MedicationDatabase:
             filepath: Chemin de destination
         """
         data = {
-            "medications": sorted(list(self.medications))
+            "medications": sorted(self.medications)
         }
         
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -201,38 +397,267 @@ class MedicationDatabase:
         Compile un pattern regex à partir de tous les médicaments.
         Utilise le Trie pour optimisation.
         """
-        if not self.medications:
-            self.medication_pattern = re.compile(r'(?!)')  # Pattern qui ne match jamais
+        # Aucun nouveau médicament depuis la dernière compilation
+        if len(self._lookup) == self._compiled_count:
+            self._dirty = False
             return
         
-        # Trier par longueur décroissante (matcher les plus longs d'abord)
-        sorted_meds = sorted(self.medications, key=len, reverse=True)
+        self._dirty = False
+        self._compiled_count = len(self._lookup)
+        self._bytes_pattern = None
+        medications = self.medications
         
-        # Échapper les caractères spéciaux regex
-        escaped_meds = [re.escape(med) for med in sorted_meds]
+        if not medications:
+            self._medication_pattern = re.compile(r'(?!)')  # Pattern qui ne match jamais
+            self._folded_pattern = None
+            return
+        
+        # Une seule entrée par nom en minuscules sans accents (IGNORECASE
+        # rend la casse indifférente); les suffixes optionnels gourmands
+        # matchent les plus longs d'abord
+        spellings = {}
+        for med in medications:
+            lowered = med.lower()
+            key = self._remove_accents(lowered)
+            if len(key) != len(lowered):
+                key = lowered  # Décomposition non caractère à caractère
+            spellings.setdefault(key, set()).add(lowered)
+        trie = _build_trie(sorted(spellings))
+        
+        # Accents couverts par une classe (ex: parac[eé]tamol), uniquement
+        # aux positions où la base en contient
+        variants: Dict[Tuple[int, str], Set[str]] = {}
+        for key, lowered_forms in spellings.items():
+            for lowered in lowered_forms:
+                if lowered == key:
+                    continue
+                node = trie
+                for base, char in zip(key, lowered):
+                    if base != char:
+                        variants.setdefault((id(node), base), {base}).add(char)
+                    node = node[base]
+        classes = {edge: ''.join(sorted(chars)) for edge, chars in variants.items()}
         
         # Créer le pattern avec word boundaries
-        pattern_str = r'\b(?:' + '|'.join(escaped_meds) + r')\b'
+        pattern_str = r'\b(?:' + _trie_to_regex(trie, classes) + r')\b'
         
         # Compiler avec IGNORECASE pour capturer variations
-        self.medication_pattern = re.compile(pattern_str, re.IGNORECASE)
+        self._medication_pattern = re.compile(pattern_str, re.IGNORECASE)
+        
+        logger.debug(f"Pattern regex compilé avec {len(medications)} médicaments")
+        
+        keys = sorted({_fold(med) for med in medications})
+        
+        if hyperscan is not None:
+            # Hyperscan: tous les motifs compilés en un seul automate
+            # vectorisé (SIMD), scanné en une passe sur le texte encodé
+            self._hs_db = hyperscan.Database()
+            self._hs_db.compile(
+                expressions=[re.escape(key).encode('utf-8') for key in keys],
+                ids=list(range(len(keys))),
+                elements=len(keys),
+                flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8] * len(keys)
+            )
+            logger.debug("Base Hyperscan compilée")
+        elif ahocorasick is not None:
+            # Automate Aho-Corasick: une seule passe linéaire sur le texte,
+            # quel que soit le nombre de médicaments
+            self._automaton = ahocorasick.Automaton()
+            for key in keys:
+                self._automaton.add_word(key, len(key))
+            self._automaton.make_automaton()
+            logger.debug("Automate Aho-Corasick construit")
+        else:
+            # Texte normalisé une seule fois par recherche: pas de
+            # repliement de casse à chaque position comme avec IGNORECASE
+            self._folded_pattern = re.compile(
+                r'\b(?:' + _trie_to_regex(_build_trie(keys)) + r')\b'
+            )
+    
+    def _spans_with_hyperscan(self, folded: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        Positions (début, fin) des médicaments trouvés par Hyperscan.
         
-        logger.debug(f"Pattern regex compilé avec {len(self.medications)} médicaments")
+        Args:
+            folded: Texte normalisé (minuscules, sans accents)
+            
+        Returns:
+            Positions en caractères dans le texte, ou None si l'espace de
+            travail de la base est déjà utilisé par un scan concurrent
+        """
+        # 'replace': un surrogate isolé (ex: "\ud800" reçu en JSON) devient
+        # "?", un octet pour un caractère; l'UTF-8 scanné reste valide
+        encoded = folded.encode('utf-8', 'replace')
+        byte_spans: List[Tuple[int, int]] = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            context.append((start, end))
+        
+        try:
+            self._hs_db.scan(encoded, match_event_handler=on_match, context=byte_spans)
+        except hyperscan.ScratchInUseError:
+            return None
+        
+        if folded.isascii() or not byte_spans:
+            return byte_spans
+        
+        # Texte non-ASCII: positions en octets → caractères, en décodant
+        # chaque segment entre deux positions triées (un seul passage)
+        char_offsets: Dict[int, int] = {}
+        char_index = 0
+        previous = 0
+        for offset in sorted({offset for span in byte_spans for offset in span}):
+            char_index += len(encoded[previous:offset].decode('utf-8'))
+            char_offsets[offset] = char_index
+            previous = offset
+        
+        return [(char_offsets[start], char_offsets[end]) for start, end in byte_spans]
+    
+    def _spans_with_automaton(self, folded: str) -> List[Tuple[int, int]]:
+        """
+        Positions (début, fin) des médicaments trouvés par Aho-Corasick.
+        
+        Args:
+            folded: Texte normalisé (minuscules, sans accents)
+            
+        Returns:
+            Positions en caractères dans le texte
+        """
+        return [
+            (end_index - length + 1, end_index + 1)
+            for end_index, length in self._automaton.iter(folded)
+        ]
+    
+    def _select_matches(self, text: str, spans: List[Tuple[int, int]]) -> List[str]:
+        """
+        Filtre les correspondances brutes d'un automate multi-motifs.
+        
+        Reproduit la sémantique du pattern regex: orthographe indexée (voir
+        _is_indexed_spelling), frontières de mots, et à chaque position la
+        correspondance la plus longue, sans chevauchement.
+        
+        Args:
+            text: Texte original
+            spans: Positions (début, fin) candidates
+            
+        Returns:
+            Liste des médicaments trouvés (noms canoniques)
+        """
+        candidates = [
+            (start, end) for start, end in spans
+            if not (start > 0 and _is_word_char(text[start - 1]))
+            and not (end < len(text) and _is_word_char(text[end]))
+            and self._is_indexed_spelling(text[start:end])
+        ]
+        
+        # Plus à gauche d'abord, puis plus long d'abord
+        candidates.sort(key=lambda span: (span[0], -span[1]))
+        
+        found = []
+        last_end = 0
+        for start, end in candidates:
+            if start >= last_end:
+                found.append(self._canonical_name(text[start:end]))
+                last_end = end
+        return found
+    
+    def _is_indexed_spelling(self, matched: str) -> bool:
+        """
+        Indique si une correspondance sur le texte normalisé est écrite comme
+        un nom de la base (à la casse près, avec ou sans ses accents).
+        
+        La normalisation accepte n'importe quelle variante accentuée
+        ("oxygéné" pour "oxygène"); medication_pattern n'accepte que les
+        accents des orthographes indexées, que l'on retrouve ici.
+        
+        Args:
+            matched: Texte tel qu'écrit
+            
+        Returns:
+            True si l'orthographe figure dans l'index
+        """
+        return matched.isascii() or matched.lower() in self._lookup
+    
+    def _canonical_name(self, matched: str) -> str:
+        """
+        Retrouve le nom canonique d'une correspondance.
+        
+        Args:
+            matched: Texte tel qu'écrit (ex: "PARACÉTAMOL")
+            
+        Returns:
+            Nom tel qu'enregistré dans la base (ex: "paracétamol")
+        """
+        canonical = self._lookup.get(matched.lower())
+        if canonical is None:
+            canonical = self._lookup.get(_fold(matched), matched)
+        return canonical
     
-    def find_medications(self, text: str) -> List[str]:
+    def find_medications(self, text: Union[str, bytes]) -> List[str]:
         """
         Trouve tous les médicaments dans un texte.
         
         Args:
-            text: Texte à analyser
+            text: Texte à analyser (str, ou bytes UTF-8 tels que reçus)
             
         Returns:
-            Liste des médicaments trouvés
+            Liste des médicaments trouvés (noms canoniques)
         """
-        if not self.medication_pattern:
+        if self._dirty:
+            self._compile_pattern()
+        
+        if isinstance(text, bytes):
+            if text.isascii():
+                return self._find_in_ascii_bytes(text)
+            text = text.decode('utf-8')
+        
+        if self._hs_db is not None:
+            spans = self._spans_with_hyperscan(_fold(text))
+            if spans is not None:
+                return self._select_matches(text, spans)
+            # Base partagée en cours de scan dans un autre thread: regex
+            return [
+                self._canonical_name(match.group())
+                for match in self._medication_pattern.finditer(text)
+            ]
+        
+        if self._automaton is not None:
+            return self._select_matches(text, self._spans_with_automaton(_fold(text)))
+        
+        if self._folded_pattern is None:
             return []
         
-        return self.medication_pattern.findall(text)
+        return [
+            self._canonical_name(matched)
+            for matched in (
+                text[match.start():match.end()]
+                for match in self._folded_pattern.finditer(_fold(text))
+            )
+            if self._is_indexed_spelling(matched)
+        ]
+    
+    def _find_in_ascii_bytes(self, data: bytes) -> List[str]:
+        """
+        Recherche directe sur un buffer ASCII, sans décodage en str.
+        
+        En ASCII, la normalisation se réduit à bytes.lower() et les
+        frontières de mots bytes sont celles du texte.
+        
+        Args:
+            data: Texte ASCII encodé
+            
+        Returns:
+            Liste des médicaments trouvés (noms canoniques)
+        """
+        if self._bytes_pattern is None:
+            keys = sorted({_fold(med) for med in self.medications})
+            pattern_str = r'\b(?:' + _trie_to_regex(_build_trie(keys)) + r')\b' if keys else r'(?!)'
+            self._bytes_pattern = re.compile(pattern_str.encode('utf-8'))
+        
+        return [
+            self._canonical_name(match.decode('ascii'))
+            for match in self._bytes_pattern.findall(data.lower())
+        ]
     
     def is_medication(self, word: str) -> bool:
         """
@@ -245,10 +670,12 @@ class MedicationDatabase:
             True si c'est un médicament connu
         """
         normalized = word.lower()
-        return (
-            normalized in self.normalized_medications or
-            self._remove_accents(normalized) in self.normalized_medications
-        )
+        if normalized in self._lookup:
+            return True
+        
+        # Variantes sans accents déjà indexées à l'ajout: n'enlever les
+        # accents de la requête qu'en cas d'échec
+        return self._remove_accents(normalized) in self._lookup
     
     def _remove_accents(self, text: str) -> str:
         """
@@ -260,8 +687,12 @@ class MedicationDatabase:
         Returns:
             Texte sans accents
         """
-        import unicodedata
-        nfkd_form = unicodedata.normalize('NFKD', text)
+        stripped = text.translate(_ACCENT_TABLE)
+        if stripped.isascii():
+            return stripped
+        
+        # Caractères hors table: décomposition NFKD complète
+        nfkd_form = unicodedata.normalize('NFKD', stripped)
         return ''.join([c for c in nfkd_form if not unicodedata.combining(c)])
 
 
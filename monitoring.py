@@ -4,19 +4,158 @@ Responsabilité: Traçabilité complète des requêtes et détection d'anomalies
 """
 
 import logging
+import logging.handlers
+import os
+import queue
 import json
 import time
-from datetime import datetime
-from typing import Dict, Any, Optional
+import statistics
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import sys
 
-from config import LOG_FILE, LOG_LEVEL
+try:
+    import orjson
+except ImportError:  # Sérialisation rapide optionnelle (orjson)
+    orjson = None
+
+from config import (
+    LOG_FILE, LOG_LEVEL, LOG_MAX_BYTES, LOG_BACKUP_COUNT, LOG_FLUSH_INTERVAL_S,
+    STATS_WINDOW_SIZE
+)
+
+
+# HORODATAGE
+
+# (seconde, "AAAA-MM-JJTHH:MM:SS"): la partie en secondes n'est reformatée
+# qu'une fois par seconde (tuple remplacé d'un bloc, sûr entre threads)
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _fast_utc_iso() -> str:
+    """
+    Horodatage UTC ISO 8601 en microsecondes (ex: 2024-01-01T12:00:00.123456Z).
+    
+    Returns:
+        Horodatage courant
+    """
+    global _ts_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _ts_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1e6):06d}Z"
+
+
+# SÉRIALISATION JSON
+
+def _to_json(obj: Any, indent: bool = False) -> str:
+    """
+    Sérialise un dict ou une dataclass en JSON.
+    
+    Args:
+        obj: Objet à sérialiser
+        indent: Indenter la sortie (2 espaces)
+        
+    Returns:
+        Chaîne JSON (caractères non-ASCII conservés)
+    """
+    if orjson is not None:
+        # orjson sérialise directement les dataclasses, en C
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    
+    if isinstance(obj, _StructuredLog):
+        obj = obj.to_dict()
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
 
 
 # CONFIGURATION DU LOGGING
 
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Fichier de log rotatif à écriture bufferisée.
+    
+    Un FileHandler vide son buffer à chaque record; ici un minuteur vide le
+    buffer au plus flush_interval secondes après le premier record non
+    écrit, même si le trafic s'arrête. WARNING et plus (dont les rejets de
+    sécurité) sont écrits immédiatement. La taille du fichier est suivie en
+    mémoire, en octets, pour ne pas forcer un flush par tell().
+    """
+    
+    BUFFER_SIZE = 65536
+    
+    def __init__(self, *args, flush_interval: float = 1.0, **kwargs):
+        self._flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+        self._size = 0
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        stream = open(
+            self.baseFilename, self.mode, encoding=self.encoding,
+            errors=self.errors, buffering=self.BUFFER_SIZE
+        )
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            size = len(msg) if msg.isascii() else len(
+                msg.encode(self.encoding or 'utf-8', self.errors or 'strict')
+            )
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _timed_flush(self) -> None:
+        """Vidage différé déclenché par le minuteur (thread du minuteur)."""
+        self.acquire()
+        try:
+            self._flush_timer = None
+            self.flush()
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        finally:
+            self.release()
+        super().close()
+
+
+# Thread d'écriture du fichier de log et handler qui l'alimente depuis le
+# logger racine (créés par setup_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
 def setup_logging():
     """
     Configure le système de logging avec sorties console et fichier.
@@ -24,7 +163,12 @@ def setup_logging():
     FORMAT:
     - Console: INFO et plus, format lisible
     - Fichier: DEBUG et plus, format JSON pour analyse ultérieure
+    
+    Le fichier est écrit par un thread dédié (QueueListener): les requêtes
+    ne font qu'empiler les records, sans attendre l'écriture disque.
     """
+    global _log_listener, _log_queue_handler
+    
     # Créer le logger racine
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, LOG_LEVEL))
@@ -45,13 +189,28 @@ def setup_logging():
     console_handler.setFormatter(console_formatter)
     
     # Handler fichier
-    file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+    file_handler = _BufferedRotatingFileHandler(
+        LOG_FILE,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding='utf-8',
+        delay=True,
+        flush_interval=LOG_FLUSH_INTERVAL_S
+    )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
     
+    # File d'attente vers le thread d'écriture du fichier
+    log_queue: queue.Queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    
     # Ajouter les handlers
+    _log_queue_handler = logging.handlers.QueueHandler(log_queue)
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(_log_queue_handler)
     
     logging.info("=" * 80)
     logging.info("YAMA Medical Translation Service - Logging initialisé")
@@ -60,8 +219,17 @@ def setup_logging():
 
 # DATACLASSES POUR STRUCTURED LOGGING
 
-@dataclass
-class TranslationRequestLog:
+class _StructuredLog:
+    """Base des logs structurés (champs plats, pas besoin de deepcopy)"""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Conversion en dict, plus rapide que dataclasses.asdict."""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@dataclass(slots=True)
+class TranslationRequestLog(_StructuredLog):
     """Log structuré d'une requête de traduction"""
     timestamp: str
     request_id: str
@@ -73,8 +241,8 @@ class TranslationRequestLog:
     user_agent: Optional[str] = None
 
 
-@dataclass
-class TranslationResponseLog:
+@dataclass(slots=True)
+class TranslationResponseLog(_StructuredLog):
     """Log structuré d'une réponse de traduction"""
     timestamp: str
     request_id: str
@@ -87,8 +255,8 @@ class TranslationResponseLog:
     error_message: Optional[str] = None
 
 
-@dataclass
-class SafetyViolationLog:
+@dataclass(slots=True)
+class SafetyViolationLog(_StructuredLog):
     """Log structuré d'une violation de sécurité"""
     timestamp: str
     request_id: str
@@ -111,6 +279,9 @@ class TranslationMonitor:
     3. Métriques de performance
     """
     
+    # Durée de validité des statistiques en cache (secondes)
+    STATS_CACHE_TTL_S = 0.1
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
@@ -121,10 +292,18 @@ class TranslationMonitor:
         self.total_safety_violations = 0
         
         # Métriques de performance
-        self.translation_times = []
+        # Moyenne courante (Welford) sur toutes les requêtes, en O(1);
+        # fenêtre bornée des temps récents pour les percentiles
+        self._times: deque = deque(maxlen=STATS_WINDOW_SIZE)
+        self._count = 0
+        self._mean = 0.0
         self.max_translation_time = 0.0
         self.min_translation_time = float('inf')
         
+        # Dernières statistiques calculées, par include_percentiles:
+        # (instant monotonic, stats), réutilisées pendant STATS_CACHE_TTL_S
+        self._stats_cache: Dict[bool, Tuple[float, Dict[str, Any]]] = {}
+        
         self.logger.info("TranslationMonitor initialisé")
     
     def log_request(
@@ -149,25 +328,24 @@ class TranslationMonitor:
         """
         self.total_requests += 1
         
-        log_entry = TranslationRequestLog(
-            timestamp=datetime.utcnow().isoformat(),
-            request_id=request_id,
-            source_lang=source_lang,
-            target_lang=target_lang,
-            source_text_length=len(source_text),
-            source_text_preview=source_text[:100],
-            client_ip=client_ip,
-            user_agent=user_agent
-        )
-        
         self.logger.info(
-            f"REQUÊTE [{request_id}] | "
-            f"{source_lang}→{target_lang} | "
-            f"Longueur: {len(source_text)} chars"
+            "REQUÊTE [%s] | %s→%s | Longueur: %d chars",
+            request_id, source_lang, target_lang, len(source_text)
         )
         
-        # Log JSON détaillé pour analyse
-        self.logger.debug(f"Request details: {json.dumps(asdict(log_entry), ensure_ascii=False)}")
+        # Log JSON détaillé pour analyse (construit seulement si DEBUG actif)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            log_entry = TranslationRequestLog(
+                timestamp=_fast_utc_iso(),
+                request_id=request_id,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                source_text_length=len(source_text),
+                source_text_preview=source_text[:100],
+                client_ip=client_ip,
+                user_agent=user_agent
+            )
+            self.logger.debug("Request details: %s", _to_json(log_entry))
     
     def log_response(
         self,
@@ -199,44 +377,44 @@ class TranslationMonitor:
             status_icon = "❌"
         
         # Mise à jour des métriques de performance
-        self.translation_times.append(translation_time_ms)
+        self._count += 1
+        self._mean += (translation_time_ms - self._mean) / self._count
+        self._times.append(translation_time_ms)
         self.max_translation_time = max(self.max_translation_time, translation_time_ms)
         if translation_time_ms > 0:
             self.min_translation_time = min(self.min_translation_time, translation_time_ms)
         
-        log_entry = TranslationResponseLog(
-            timestamp=datetime.utcnow().isoformat(),
-            request_id=request_id,
-            success=success,
-            translation_time_ms=translation_time_ms,
-            translated_text_length=len(translated_text),
-            translated_text_preview=translated_text[:100] if translated_text else "",
-            safety_warnings=safety_warnings or [],
-            error_code=error_code,
-            error_message=error_message
-        )
-        
         self.logger.info(
-            f"{status_icon} RÉPONSE [{request_id}] | "
-            f"Temps: {translation_time_ms:.2f}ms | "
-            f"Longueur: {len(translated_text)} chars"
+            "%s RÉPONSE [%s] | Temps: %.2fms | Longueur: %d chars",
+            status_icon, request_id, translation_time_ms, len(translated_text)
         )
         
         if not success:
             self.logger.error(
-                f"❌ ÉCHEC [{request_id}] | "
-                f"Code: {error_code} | "
-                f"Message: {error_message}"
+                "❌ ÉCHEC [%s] | Code: %s | Message: %s",
+                request_id, error_code, error_message
             )
         
         if safety_warnings:
             self.logger.warning(
-                f"⚠️ WARNINGS [{request_id}] | "
-                f"Nombre: {len(safety_warnings)}"
+                "⚠️ WARNINGS [%s] | Nombre: %d",
+                request_id, len(safety_warnings)
             )
         
-        # Log JSON détaillé
-        self.logger.debug(f"Response details: {json.dumps(asdict(log_entry), ensure_ascii=False)}")
+        # Log JSON détaillé (construit seulement si DEBUG actif)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            log_entry = TranslationResponseLog(
+                timestamp=_fast_utc_iso(),
+                request_id=request_id,
+                success=success,
+                translation_time_ms=translation_time_ms,
+                translated_text_length=len(translated_text),
+                translated_text_preview=translated_text[:100] if translated_text else "",
+                safety_warnings=safety_warnings or [],
+                error_code=error_code,
+                error_message=error_message
+            )
+            self.logger.debug("Response details: %s", _to_json(log_entry))
     
     def log_safety_violation(
         self,
@@ -263,42 +441,63 @@ class TranslationMonitor:
         """
         self.total_safety_violations += 1
         
-        log_entry = SafetyViolationLog(
-            timestamp=datetime.utcnow().isoformat(),
-            request_id=request_id,
-            violation_type=violation_type,
-            source_text=source_text[:200],  # Tronquer pour log
-            translated_text=translated_text[:200],
-            details=details,
-            severity=severity
-        )
-        
         self.logger.critical(
-            f"VIOLATION DE SÉCURITÉ [{request_id}] | "
-            f"Type: {violation_type} | "
-            f"Sévérité: {severity}"
+            "VIOLATION DE SÉCURITÉ [%s] | Type: %s | Sévérité: %s",
+            request_id, violation_type, severity
         )
         
-        self.logger.critical(
-            f"Details: {details}"
-        )
+        self.logger.critical("Details: %s", details)
         
         # Log JSON pour analyse forensique
-        self.logger.critical(
-            f"Violation details: {json.dumps(asdict(log_entry), ensure_ascii=False)}"
-        )
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            log_entry = SafetyViolationLog(
+                timestamp=_fast_utc_iso(),
+                request_id=request_id,
+                violation_type=violation_type,
+                source_text=source_text[:200],  # Tronquer pour log
+                translated_text=translated_text[:200],
+                details=details,
+                severity=severity
+            )
+            self.logger.critical("Violation details: %s", _to_json(log_entry))
     
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self, include_percentiles: bool = False) -> Dict[str, Any]:
         """
-        Retourne les statistiques globales du service.
+        Retourne les statistiques globales du service (sans logging).
+        
+        Les scrapes rapprochés (/health, /statistics) réutilisent le dernier
+        calcul pendant STATS_CACHE_TTL_S.
+        
+        Args:
+            include_percentiles: Ajouter p50/p95/p99 (calculés sur les
+                STATS_WINDOW_SIZE dernières requêtes)
         
         Returns:
             Dictionnaire avec toutes les métriques
         """
-        avg_time = (
-            sum(self.translation_times) / len(self.translation_times)
-            if self.translation_times else 0
-        )
+        now = time.monotonic()
+        cached = self._stats_cache.get(include_percentiles)
+        if cached is not None and now - cached[0] < self.STATS_CACHE_TTL_S:
+            return cached[1]
+        
+        stats = self._compute_statistics(include_percentiles)
+        self._stats_cache[include_percentiles] = (now, stats)
+        return stats
+    
+    def log_statistics(self) -> Dict[str, Any]:
+        """
+        Calcule et log les statistiques (format JSON lisible).
+        
+        Returns:
+            Dictionnaire avec toutes les métriques
+        """
+        stats = self._compute_statistics(include_percentiles=True)
+        self.logger.info("📊 Statistiques: %s", _to_json(stats, indent=True))
+        return stats
+    
+    def _compute_statistics(self, include_percentiles: bool) -> Dict[str, Any]:
+        """Calcule les statistiques courantes (voir get_statistics)."""
+        avg_time = self._mean
         
         success_rate = (
             (self.total_successes / self.total_requests * 100)
@@ -318,7 +517,14 @@ class TranslationMonitor:
             }
         }
         
-        self.logger.info(f"📊 Statistiques: {json.dumps(stats, indent=2)}")
+        if include_percentiles and len(self._times) >= 2:
+            cuts = statistics.quantiles(self._times, n=100, method='inclusive')
+            stats["performance"].update({
+                "p50_translation_time_ms": round(cuts[49], 2),
+                "p95_translation_time_ms": round(cuts[94], 2),
+                "p99_translation_time_ms": round(cuts[98], 2),
+            })
+        
         return stats
     
     def log_startup(self, model_name: str, device: str) -> None:
@@ -332,9 +538,9 @@ class TranslationMonitor:
         self.logger.info("=" * 80)
         self.logger.info("🏥 YAMA MEDICAL TRANSLATION SERVICE - DÉMARRAGE")
         self.logger.info("=" * 80)
-        self.logger.info(f"📦 Modèle: {model_name}")
-        self.logger.info(f"💻 Device: {device}")
-        self.logger.info(f"🕐 Timestamp: {datetime.utcnow().isoformat()}")
+        self.logger.info("📦 Modèle: %s", model_name)
+        self.logger.info("💻 Device: %s", device)
+        self.logger.info("🕐 Timestamp: %s", datetime.now(timezone.utc).isoformat())
         self.logger.info("=" * 80)
     
     def log_shutdown(self) -> None:
@@ -344,12 +550,39 @@ class TranslationMonitor:
         self.logger.info("=" * 80)
         
         # Afficher les stats finales
-        self.get_statistics()
+        self.log_statistics()
         
-        self.logger.info(f"🕐 Timestamp: {datetime.utcnow().isoformat()}")
+        self.logger.info("🕐 Timestamp: %s", datetime.now(timezone.utc).isoformat())
         self.logger.info("=" * 80)
 
 
+def stop_logging() -> None:
+    """
+    Arrête le thread d'écriture du fichier de log (records en attente écrits).
+    
+    À appeler en dernier à l'arrêt du service. Le fichier est rattaché
+    directement au logger racine à la place du QueueHandler: les records
+    émis ensuite (ex: par uvicorn) y sont encore écrits, de façon
+    synchrone, jusqu'à la fermeture par logging.shutdown().
+    """
+    global _log_listener, _log_queue_handler
+    if _log_listener is None:
+        return
+    
+    root_logger = logging.getLogger()
+    for handler in _log_listener.handlers:
+        root_logger.addHandler(handler)
+    if _log_queue_handler is not None:
+        root_logger.removeHandler(_log_queue_handler)
+        _log_queue_handler = None
+    
+    # Vide la file (records déjà empilés) puis arrête le thread
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.flush()
+    _log_listener = None
+
+
 # INSTANCE GLOBALE
 
 # Instance singleton du monitor (sera initialisée au démarrage de l'app)
@@ -4,16 +4,38 @@ Responsabilité: Garantir qu'aucune information critique n'est perdue ou altér
 """
 
 import re
-from typing import Dict, List, Tuple, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple, Optional, Sequence
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 import logging
 
+try:
+    import ahocorasick
+except ImportError:  # Accélération optionnelle (pyahocorasick)
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # Accélération optionnelle (automate SIMD, x86 uniquement)
+    hyperscan = None
+
+try:
+    import pcre2
+except ImportError:  # Accélération optionnelle (PCRE2 compilé en JIT)
+    pcre2 = None
+
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # Accélération optionnelle (similarité en C++)
+    Indel = None
+
 from config import (
     CRITICAL_NEGATIONS_FR,
     CRITICAL_NEGATIONS_WO,
-    DOSAGE_PATTERNS,
-    MEDICAL_VALUES_PATTERNS,
+    DOSAGE_PATTERNS_COMPILED,
+    MEDICAL_VALUES_PATTERNS_COMPILED,
     NUMERIC_SIMILARITY_THRESHOLD,
     MEDICATION_DATABASE_PATH
 )
@@ -21,17 +43,160 @@ from config import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Pattern pour extraire tous les nombres (entiers et décimaux)
+NUMBER_PATTERN = re.compile(r'\b\d+(?:[.,]\d+)?\b')
+
+
+@lru_cache(maxsize=128)
+def _find_numbers(text: str) -> Tuple[str, ...]:
+    """
+    Nombres d'un texte, mémorisés: la restauration puis les vérifications
+    de sécurité analysent les mêmes textes source et traduit.
+    """
+    return tuple(NUMBER_PATTERN.findall(text))
+
+
+def _normalize_numbers(numbers: Sequence[str]) -> List[str]:
+    """
+    Décimales à virgule → point, en un seul replace sur la liste jointe
+    (les nombres ne contiennent pas d'espace).
+    """
+    return ' '.join(numbers).replace(',', '.').split()
+
+
+def _build_negation_automaton(negations: List[str]):
+    """
+    Automate Aho-Corasick des négations (en minuscules): une seule passe
+    sur le texte, quel que soit le nombre de négations.
+    
+    Returns:
+        Automate dont les valeurs sont les négations originales
+    """
+    automaton = ahocorasick.Automaton()
+    for negation in negations:
+        automaton.add_word(negation.lower(), negation)
+    automaton.make_automaton()
+    return automaton
+
+
+# Placeholders de masquage (voir mask_protected_elements). Pas de \b final:
+# un placeholder collé à un mot par le modèle (ex: "VALUE0mg") est reconnu
+PLACEHOLDER_RE = re.compile(r'\b(?:MEDICATION[A-Z]+|DOSAGE\d+|VALUE\d+)')
+
+
+def _restore_by_position(
+    text: str,
+    source_values: List[str],
+    find_matches: Callable[[str], List[re.Match]],
+    label: str
+) -> str:
+    """
+    Restaure les valeurs du source absentes du texte, chacune à la position
+    de la valeur de même rang dans le texte.
+    
+    La présence est vérifiée sur le texte déjà corrigé (une correction peut
+    en retirer une autre valeur) et les positions, recherchées seulement si
+    une correction est nécessaire, sont recalculées après chacune.
+    
+    Args:
+        text: Texte traduit
+        source_values: Valeurs du source, dans l'ordre d'appariement
+        find_matches: Recherche des valeurs du texte, dans le même ordre
+        label: Début du message d'avertissement (ex: "Nombre modifié détecté")
+        
+    Returns:
+        Texte corrigé
+    """
+    matches = None
+    for i, source_value in enumerate(source_values):
+        if source_value in text:
+            continue
+        if matches is None:
+            matches = find_matches(text)
+        if i >= len(matches):
+            break
+        wrong_match = matches[i]
+        logger.warning(
+            f"{label}: '{wrong_match.group()}' → '{source_value}' (restauration)"
+        )
+        start, end = wrong_match.span()
+        text = text[:start] + source_value + text[end:]
+        matches = None
+    return text
+
+
+def _medication_letters(index: int) -> str:
+    """Suffixe de placeholder médicament: A, B, ..., Z, AA, AB, ..."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class _Pcre2SearchPattern:
+    """
+    Pattern PCRE2 avec repli sur re pour les textes non encodables en UTF-8
+    (surrogate isolé, ex: "\\ud800" reçu en JSON), que PCRE2 refuse.
+    """
+    __slots__ = ("pattern", "_compiled", "_fallback")
+    
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._compiled = pcre2.compile(pattern, pcre2.IGNORECASE)
+        self._fallback = re.compile(pattern, re.IGNORECASE)
+    
+    def search(self, text: str):
+        try:
+            return self._compiled.search(text)
+        except UnicodeEncodeError:
+            return self._fallback.search(text)
+
+
+def _compile_search_pattern(pattern: str):
+    """
+    Compile un pattern insensible à la casse utilisé uniquement via search().
+    
+    PCRE2 (compilé en JIT) parcourt un texte sans correspondance, le cas
+    courant pour les négations et les injections, bien plus vite que re.
+    Ses findall/sub sont en revanche plus lents: les autres patterns
+    restent sur re.
+    
+    Returns:
+        Pattern PCRE2 (avec repli sur re) si disponible, sinon re.Pattern
+    """
+    if pcre2 is not None:
+        try:
+            return _Pcre2SearchPattern(pattern)
+        except pcre2.error:
+            logger.debug("Pattern non supporté par PCRE2, repli sur re: %s", pattern)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _build_negation_regex(negations: List[str]):
+    """Alternance insensible à la casse des négations (plus longues d'abord)."""
+    escaped = [re.escape(neg) for neg in sorted(negations, key=len, reverse=True)]
+    return _compile_search_pattern('|'.join(escaped))
+
+
+# Groupe nommé de la regex combinée → catégorie d'éléments protégés
+_COMBINED_CATEGORIES: Dict[str, str] = {
+    "med": "medications",
+    "val": "medical_values",
+    "dose": "dosages",
+    "num": "all_numbers",
+}
+
+
+@dataclass(slots=True)
 class SafetyCheckResult:
     """Résultat d'une vérification de sécurité"""
     is_safe: bool
     error_code: Optional[str] = None
     error_message: Optional[str] = None
-    warnings: List[str] = None
-    
-    def __post_init__(self):
-        if self.warnings is None:
-            self.warnings = []
+    # Tuple vide partagé par défaut: la plupart des résultats n'ont aucun warning
+    warnings: Sequence[str] = ()
 
 
 class MedicalSafetyChecker:
@@ -73,12 +238,49 @@ class MedicalSafetyChecker:
                 )
             ]
         
-        # Compilation des patterns regex pour performance
-        self.dosage_regex = [re.compile(p, re.IGNORECASE) for p in DOSAGE_PATTERNS]
-        self.medical_values_regex = [re.compile(p, re.IGNORECASE) for p in MEDICAL_VALUES_PATTERNS]
+        # Patterns regex précompilés dans config.py
+        self.dosage_regex = DOSAGE_PATTERNS_COMPILED
+        self.medical_values_regex = MEDICAL_VALUES_PATTERNS_COMPILED
+        
+        # Union des posologies (un groupe nommé par pattern): un seul passage
+        # au lieu d'un par pattern
+        self.dosage_union_regex = re.compile(
+            '|'.join(f"(?P<d{i}>{p.pattern})" for i, p in enumerate(self.dosage_regex)),
+            re.IGNORECASE
+        )
         
         # Pattern pour extraire tous les nombres (entiers et décimaux)
-        self.number_pattern = re.compile(r'\b\d+(?:[.,]\d+)?\b')
+        self.number_pattern = NUMBER_PATTERN
+        
+        # Détection des négations: alternances insensibles à la casse
+        # (sans copie en minuscules du texte), ou automates Aho-Corasick si
+        # pyahocorasick est installé
+        self._negation_regexes = {
+            "fr": _build_negation_regex(CRITICAL_NEGATIONS_FR),
+            "wo": _build_negation_regex(CRITICAL_NEGATIONS_WO),
+        }
+        self._negation_automata = None
+        if ahocorasick is not None:
+            self._negation_automata = {
+                "fr": _build_negation_automaton(CRITICAL_NEGATIONS_FR),
+                "wo": _build_negation_automaton(CRITICAL_NEGATIONS_WO),
+            }
+        
+        # Regex combinée: un seul passage sur le texte, chaque élément étant
+        # classé par son groupe nommé (priorité: médicament > valeur médicale,
+        # plus spécifique, ex: "1,2 g/dl" > posologie > nombre)
+        self.combined_regex = re.compile(
+            '|'.join(
+                f"(?P<{name}>" + '|'.join(p.pattern for p in patterns) + ")"
+                for name, patterns in (
+                    ("med", self.medication_regex),
+                    ("val", self.medical_values_regex),
+                    ("dose", self.dosage_regex),
+                    ("num", [self.number_pattern]),
+                )
+            ),
+            re.IGNORECASE
+        )
         
         logger.info("MedicalSafetyChecker initialisé avec succès")
     
@@ -102,20 +304,16 @@ class MedicalSafetyChecker:
             "all_numbers": []
         }
         
-        # Extraction des médicaments
-        for pattern in self.medication_regex:
-            protected["medications"].extend(pattern.findall(text))
+        # Médicaments, posologies et valeurs en un seul passage, chaque
+        # élément dans sa catégorie (sans chevauchement)
+        for match in self.combined_regex.finditer(text):
+            category = _COMBINED_CATEGORIES[match.lastgroup]
+            if category != "all_numbers":
+                protected[category].append(match.group())
         
-        # Extraction des posologies
-        for pattern in self.dosage_regex:
-            protected["dosages"].extend(pattern.findall(text))
-        
-        # Extraction des valeurs médicales
-        for pattern in self.medical_values_regex:
-            protected["medical_values"].extend(pattern.findall(text))
-        
-        # Extraction de TOUS les nombres (sécurité ultime)
-        protected["all_numbers"] = self.number_pattern.findall(text)
+        # Extraction de TOUS les nombres (sécurité ultime), y compris ceux
+        # contenus dans une posologie ou une valeur
+        protected["all_numbers"] = list(_find_numbers(text))
         
         logger.debug(f"Éléments protégés extraits: {protected}")
         return protected
@@ -126,51 +324,42 @@ class MedicalSafetyChecker:
         translated_text: str
     ) -> str:
        
-        result = translated_text
-        
-        # Extraire les posologies du source
-        source_dosages = []
-        for pattern in self.dosage_regex:
-            source_dosages.extend(pattern.findall(source_text))
-        
-        # Extraire les posologies du traduit
-        translated_dosages = []
-        for pattern in self.dosage_regex:
-            translated_dosages.extend(pattern.findall(translated_text))
-        
-        # Remplacer les posologies modifiées
-        for i, source_dosage in enumerate(source_dosages):
-            if source_dosage not in result:
-                # La posologie a été modifiée, essayer de la restaurer
-                if i < len(translated_dosages):
-                    wrong_dosage = translated_dosages[i]
-                    logger.warning(
-                        f"Posologie modifiée détectée: '{wrong_dosage}' → '{source_dosage}' (restauration)"
-                    )
-                    result = result.replace(wrong_dosage, source_dosage, 1)
-        
-        # Extraire tous les nombres du source
-        source_numbers = self.number_pattern.findall(source_text)
-        
-        # Extraire tous les nombres du résultat actuel
-        result_numbers = self.number_pattern.findall(result)
-        
-        # Si des nombres manquent, essayer de les restaurer
-        for i, source_num in enumerate(source_numbers):
-            # Si ce nombre n'est pas dans le résultat
-            if source_num not in result:
-                # Essayer de trouver le nombre correspondant qui a été mal traduit
-                if i < len(result_numbers):
-                    wrong_num = result_numbers[i]
-                    logger.warning(
-                        f"Nombre modifié détecté: '{wrong_num}' → '{source_num}' (restauration)"
-                    )
-                    # Remplacer uniquement la première occurrence
-                    result = result.replace(wrong_num, source_num, 1)
+        # Posologies du source (un passage, regroupées par pattern), chacune
+        # restaurée à la position de la posologie correspondante du traduit.
+        # Les correspondances de l'union ne se recouvrent pas
+        source_dosages = [match.group() for match in self._find_dosages(source_text)]
+        result = _restore_by_position(
+            translated_text,
+            source_dosages,
+            self._find_dosages,
+            "Posologie modifiée détectée"
+        )
+        
+        # Nombres du source absents du résultat: restaurés à la position du
+        # nombre correspondant
+        source_numbers = _find_numbers(source_text)
+        result = _restore_by_position(
+            result,
+            source_numbers,
+            lambda text: list(NUMBER_PATTERN.finditer(text)),
+            "Nombre modifié détecté"
+        )
         
         logger.info(f"Restauration terminée: {len(source_numbers)} nombres vérifiés")
         return result
     
+    def _find_dosages(self, text: str) -> List[re.Match]:
+        """
+        Posologies du texte, regroupées par pattern (ordre de dosage_regex)
+        puis dans l'ordre du texte.
+        
+        Les heures de prise ("matin", "soir"), souvent traduites, restent
+        ainsi après les posologies chiffrées pour l'appariement source/traduit.
+        """
+        matches = list(self.dosage_union_regex.finditer(text))
+        matches.sort(key=lambda match: match.lastindex)
+        return matches
+    
     def mask_protected_elements(self, text: str) -> Tuple[str, Dict[str, str]]:
         """
         Masque les éléments protégés avec des placeholders avant traduction.
@@ -184,39 +373,27 @@ class MedicalSafetyChecker:
         Returns:
             Tuple (texte_masqué, mapping_placeholders)
         """
-        masked_text = text
         placeholder_map = {}
+        medication_counter = 0
         placeholder_counter = 0
         
-        # Masquer les médicaments avec des noms "médicaux" neutres
-        for i, pattern in enumerate(self.medication_regex):
-            for match in pattern.finditer(text):
-                med_text = match.group(0)
-                # Utiliser MEDICATION suivi d'une lettre (A, B, C, etc.)
-                placeholder = f"MEDICATION{chr(65 + placeholder_counter)}"  # A, B, C...
+        def assign_placeholder(match: re.Match) -> str:
+            nonlocal medication_counter, placeholder_counter
+            if match.lastgroup == "med":
+                # Médicaments: MEDICATION suivi de lettres (A, B, C, etc.)
+                placeholder = f"MEDICATION{_medication_letters(medication_counter)}"
+                medication_counter += 1
+            else:
+                # Posologies: DOSAGE + numéro; valeurs et nombres: VALUE + numéro
+                prefix = "DOSAGE" if match.lastgroup == "dose" else "VALUE"
+                placeholder = f"{prefix}{placeholder_counter}"
                 placeholder_counter += 1
-                if placeholder not in masked_text and med_text in masked_text:
-                    masked_text = masked_text.replace(med_text, placeholder, 1)
-                    placeholder_map[placeholder] = med_text
-        
-        # Masquer les posologies avec le pattern DOSAGE + numéro
-        for i, pattern in enumerate(self.dosage_regex):
-            for match in pattern.finditer(masked_text):
-                dosage_text = match.group(0)
-                if not dosage_text.startswith("MEDICATION") and not dosage_text.startswith("DOSAGE"):
-                    placeholder = f"DOSAGE{placeholder_counter}"
-                    placeholder_counter += 1
-                    masked_text = masked_text.replace(dosage_text, placeholder, 1)
-                    placeholder_map[placeholder] = dosage_text
-        
-        # Masquer TOUS les nombres restants avec VALUEXX
-        for match in self.number_pattern.finditer(masked_text):
-            number_text = match.group(0)
-            if not any(kw in number_text for kw in ["MEDICATION", "DOSAGE", "VALUE"]):
-                placeholder = f"VALUE{placeholder_counter}"
-                placeholder_counter += 1
-                masked_text = masked_text.replace(number_text, placeholder, 1)
-                placeholder_map[placeholder] = number_text
+            placeholder_map[placeholder] = match.group(0)
+            return placeholder
+        
+        # Un seul passage linéaire: chaque élément protégé est remplacé à
+        # sa position par un nouveau placeholder
+        masked_text = self.combined_regex.sub(assign_placeholder, text)
         
         logger.debug(f"Texte masqué: {masked_text}")
         logger.debug(f"Mapping ({len(placeholder_map)} éléments): {placeholder_map}")
@@ -234,11 +411,17 @@ class MedicalSafetyChecker:
         Returns:
             Texte avec éléments protégés réinsérés
         """
-        unmasked_text = text
-        for placeholder, original_value in placeholder_map.items():
-            unmasked_text = unmasked_text.replace(placeholder, original_value)
+        if not placeholder_map:
+            return text
         
-        logger.debug(f"Texte démasqué: {unmasked_text}")
+        # Un seul passage; VALUE1 ne peut plus remplacer le début de VALUE10
+        def restore(match: re.Match) -> str:
+            placeholder = match[0]
+            return placeholder_map.get(placeholder, placeholder)
+        
+        unmasked_text = PLACEHOLDER_RE.sub(restore, text)
+        
+        logger.debug("Texte démasqué: %s", unmasked_text)
         return unmasked_text
     
     # VÉRIFICATIONS DE SÉCURITÉ POST-TRADUCTION
@@ -256,33 +439,55 @@ class MedicalSafetyChecker:
         Returns:
             SafetyCheckResult indiquant si les nombres sont intacts
         """
-        source_numbers = self.number_pattern.findall(source)
-        translated_numbers = self.number_pattern.findall(translated)
+        source_numbers = list(_find_numbers(source))
+        translated_numbers = list(_find_numbers(translated))
+        
+        # Rejet immédiat si les quantités de nombres diffèrent (sans
+        # normalisation ni comparaison); rien à comparer si aucun nombre
+        if len(source_numbers) != len(translated_numbers):
+            return self._numeric_violation(
+                f"Source: {len(source_numbers)} nombres {source_numbers} | "
+                f"Traduit: {len(translated_numbers)} nombres {translated_numbers}"
+            )
+        if not source_numbers:
+            logger.debug("Vérification numérique: OK (aucun nombre)")
+            return SafetyCheckResult(is_safe=True)
         
         # Normaliser les nombres (remplacer virgules par points)
-        source_numbers_normalized = [n.replace(',', '.') for n in source_numbers]
-        translated_numbers_normalized = [n.replace(',', '.') for n in translated_numbers]
-        
-        # Tri pour comparaison (ordre peut changer légèrement)
-        source_numbers_normalized.sort()
-        translated_numbers_normalized.sort()
-        
-        if source_numbers_normalized != translated_numbers_normalized:
-            error_msg = (
-                f"SÉCURITÉ CRITIQUE: Intégrité numérique compromise. "
-                f"Source: {source_numbers} | Traduit: {translated_numbers}"
-            )
-            logger.error(error_msg)
-            
-            return SafetyCheckResult(
-                is_safe=False,
-                error_code="NUMERIC_INTEGRITY_VIOLATION",
-                error_message=error_msg
+        source_normalized = _normalize_numbers(source_numbers)
+        translated_normalized = _normalize_numbers(translated_numbers)
+        
+        # Cas courant: mêmes nombres dans le même ordre (comparaison de listes
+        # en C). Sinon, comparer en multiensembles (l'ordre peut changer)
+        if source_normalized == translated_normalized:
+            logger.debug("Vérification numérique: OK")
+            return SafetyCheckResult(is_safe=True)
+        
+        source_counts = Counter(source_normalized)
+        translated_counts = Counter(translated_normalized)
+        
+        if source_counts != translated_counts:
+            missing = sorted((source_counts - translated_counts).elements())
+            added = sorted((translated_counts - source_counts).elements())
+            return self._numeric_violation(
+                f"Source: {source_numbers} | Traduit: {translated_numbers} | "
+                f"Manquants: {missing} | Ajoutés: {added}"
             )
         
         logger.debug("Vérification numérique: OK")
         return SafetyCheckResult(is_safe=True)
     
+    def _numeric_violation(self, details: str) -> SafetyCheckResult:
+        """Résultat (loggé) d'une violation de l'intégrité numérique."""
+        error_msg = f"SÉCURITÉ CRITIQUE: Intégrité numérique compromise. {details}"
+        logger.error(error_msg)
+        
+        return SafetyCheckResult(
+            is_safe=False,
+            error_code="NUMERIC_INTEGRITY_VIOLATION",
+            error_message=error_msg
+        )
+    
     def check_negation_preservation(
         self, 
         source: str, 
@@ -306,26 +511,20 @@ class MedicalSafetyChecker:
         # Sélectionner la liste de négations appropriée
         if source_lang == "fra_Latn":
             source_negations = CRITICAL_NEGATIONS_FR
-            target_negations = CRITICAL_NEGATIONS_WO
+            source_key, target_key = "fr", "wo"
         else:
             source_negations = CRITICAL_NEGATIONS_WO
-            target_negations = CRITICAL_NEGATIONS_FR
-        
-        # Détecter négations dans le source
-        found_negations = []
-        for negation in source_negations:
-            if negation.lower() in source.lower():
-                found_negations.append(negation)
+            source_key, target_key = "wo", "fr"
         
         # Si des négations sont présentes dans source, 
         # il DOIT y avoir au moins une négation dans target
-        if found_negations:
-            has_target_negation = any(
-                neg.lower() in translated.lower() 
-                for neg in target_negations
-            )
-            
-            if not has_target_negation:
+        if self._contains_negation(source, source_key):
+            if not self._contains_negation(translated, target_key):
+                # Liste détaillée pour le message (chemin d'erreur uniquement)
+                source_lower = source.lower()
+                found_negations = [
+                    neg for neg in source_negations if neg.lower() in source_lower
+                ]
                 error_msg = (
                     f"SÉCURITÉ CRITIQUE: Négation perdue en traduction. "
                     f"Négations source détectées: {found_negations} | "
@@ -342,6 +541,19 @@ class MedicalSafetyChecker:
         logger.debug("Vérification négations: OK")
         return SafetyCheckResult(is_safe=True)
     
+    def _contains_negation(self, text: str, lang_key: str) -> bool:
+        """
+        Indique si le texte contient au moins une négation critique.
+        Arrêt à la première négation trouvée.
+        
+        Args:
+            text: Texte à analyser
+            lang_key: "fr" ou "wo"
+        """
+        if self._negation_automata is not None:
+            return next(self._negation_automata[lang_key].iter(text.lower()), None) is not None
+        return self._negation_regexes[lang_key].search(text) is not None
+    
     def check_length_anomaly(self, source: str, translated: str) -> SafetyCheckResult:
         """
         Vérifie qu'il n'y a pas d'anomalie de longueur suspecte.
@@ -398,8 +610,7 @@ class MedicalSafetyChecker:
             SafetyCheckResult indiquant si des placeholders subsistent
         """
         # Chercher des patterns de placeholder non remplacés
-        placeholder_pattern = re.compile(r'\b(?:MEDICATION[A-Z]|DOSAGE\d+|VALUE\d+)\b')
-        remaining_placeholders = placeholder_pattern.findall(translated)
+        remaining_placeholders = PLACEHOLDER_RE.findall(translated)
         
         if remaining_placeholders:
             error_msg = (
@@ -477,6 +688,94 @@ class MedicalSafetyChecker:
             is_safe=True,
             warnings=all_warnings
         )
+    
+    def run_full_safety_check_batch(
+        self,
+        source_texts: List[str],
+        translated_texts: List[str],
+        source_langs: List[str],
+        placeholder_maps: Optional[List[Optional[Dict[str, str]]]] = None
+    ) -> List[SafetyCheckResult]:
+        """
+        Exécute TOUTES les vérifications de sécurité sur un lot de traductions.
+        
+        Chaque vérification est appliquée à tout le lot avant la suivante, et
+        une paire rejetée sort du lot: mêmes résultats que des appels
+        successifs à run_full_safety_check.
+        
+        Args:
+            source_texts: Textes source originaux
+            translated_texts: Textes traduits finaux (même ordre)
+            source_langs: Langue source de chaque paire
+            placeholder_maps: Mapping des placeholders de chaque paire
+                (None pour la paire ou pour tout le lot si pas de masquage)
+            
+        Returns:
+            Un SafetyCheckResult par paire, dans l'ordre du lot
+        """
+        count = len(source_texts)
+        if len(translated_texts) != count or len(source_langs) != count:
+            raise ValueError(
+                "source_texts, translated_texts et source_langs doivent avoir la même longueur"
+            )
+        if placeholder_maps is None:
+            placeholder_maps = [None] * count
+        
+        logger.info("Début de la vérification de sécurité d'un lot de %d traductions", count)
+        
+        results: List[Optional[SafetyCheckResult]] = [None] * count
+        all_warnings: Dict[int, List[str]] = {}
+        
+        def run_phase(indices: List[int], check) -> List[int]:
+            """Applique un check critique; retourne les paires encore sûres."""
+            still_safe = []
+            for i in indices:
+                result = check(i)
+                if not result.is_safe:
+                    results[i] = result
+                    continue
+                if result.warnings:
+                    all_warnings.setdefault(i, []).extend(result.warnings)
+                still_safe.append(i)
+            return still_safe
+        
+        # Check 1: Intégrité numérique (CRITIQUE)
+        pending = run_phase(
+            list(range(count)),
+            lambda i: self.check_numeric_integrity(source_texts[i], translated_texts[i])
+        )
+        
+        # Check 2: Préservation des négations (CRITIQUE)
+        pending = run_phase(
+            pending,
+            lambda i: self.check_negation_preservation(
+                source_texts[i], translated_texts[i], source_langs[i]
+            )
+        )
+        
+        # Check 3: Anomalie de longueur (WARNING)
+        for i in pending:
+            length_check = self.check_length_anomaly(source_texts[i], translated_texts[i])
+            if length_check.warnings:
+                all_warnings.setdefault(i, []).extend(length_check.warnings)
+        
+        # Check 4: Intégrité des placeholders (si applicable)
+        pending = run_phase(
+            pending,
+            lambda i: (
+                self.check_placeholder_integrity(translated_texts[i], placeholder_maps[i])
+                if placeholder_maps[i] is not None
+                else SafetyCheckResult(is_safe=True)
+            )
+        )
+        
+        for i in pending:
+            results[i] = SafetyCheckResult(is_safe=True, warnings=all_warnings.get(i, ()))
+        
+        logger.info(
+            "Vérification de sécurité du lot: %d/%d traductions sûres", len(pending), count
+        )
+        return results
 
 
 # ============================================================================
@@ -485,15 +784,87 @@ class MedicalSafetyChecker:
 
 def calculate_text_similarity(text1: str, text2: str) -> float:
     """
-    Calcule la similarité entre deux textes (Ratcliff-Obershelp).
+    Calcule la similarité entre deux textes.
     
     Utilisé pour détecter si la traduction est trop différente (suspicion d'erreur)
     ou trop similaire (suspicion de non-traduction).
     
+    Avec rapidfuzz: similarité Indel (2 * LCS / longueurs cumulées), en C++.
+    Sinon: ratio Ratcliff-Obershelp de difflib (égal ou légèrement inférieur).
+    
     Returns:
         Similarité entre 0.0 (totalement différent) et 1.0 (identique)
     """
-    return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+    text1 = text1.lower()
+    text2 = text2.lower()
+    if Indel is not None:
+        return Indel.normalized_similarity(text1, text2)
+    return SequenceMatcher(None, text1, text2).ratio()
+
+
+# Patterns suspects (non exhaustif, à enrichir selon les besoins),
+# réunis en un seul automate (Hyperscan) ou une seule alternance: un passage,
+# arrêt à la première occurrence
+INJECTION_PATTERNS: List[str] = [
+    r'<script',
+    r'javascript:',
+    r'onclick=',
+    r'onerror=',
+    r'eval\(',
+    r'__import__',
+    r'exec\(',
+]
+INJECTION_RE = _compile_search_pattern('|'.join(INJECTION_PATTERNS))
+
+
+def _build_injection_database():
+    """
+    Base Hyperscan des patterns d'injection: un seul automate vectorisé
+    (SIMD) pour tous les patterns, scanné en une passe sur le texte encodé.
+    """
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode('utf-8') for pattern in INJECTION_PATTERNS],
+        ids=list(range(len(INJECTION_PATTERNS))),
+        elements=len(INJECTION_PATTERNS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+        * len(INJECTION_PATTERNS)
+    )
+    return database
+
+
+INJECTION_HS_DB = _build_injection_database() if hyperscan is not None else None
+
+
+def _find_injection(text: str) -> Optional[str]:
+    """
+    Premier pattern d'injection trouvé dans le texte.
+    
+    Returns:
+        Texte correspondant, ou None si aucun pattern ne correspond
+    """
+    if INJECTION_HS_DB is not None:
+        # surrogatepass: un surrogate isolé ne doit pas faire échouer la
+        # détection (les patterns sont ASCII, les octets encodés suffisent)
+        encoded = text.encode('utf-8', 'surrogatepass')
+        found: List[bytes] = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            context.append(encoded[start:end])
+            return True  # Arrêt au premier pattern trouvé
+        
+        try:
+            INJECTION_HS_DB.scan(encoded, match_event_handler=on_match, context=found)
+        except hyperscan.ScanTerminated:
+            pass
+        except hyperscan.ScratchInUseError:
+            # Espace de travail déjà utilisé par un scan concurrent: regex
+            found = None
+        if found is not None:
+            return found[0].decode('utf-8') if found else None
+    
+    match = INJECTION_RE.search(text)
+    return match.group() if match is not None else None
 
 
 def detect_code_injection_attempt(text: str) -> bool:
@@ -506,21 +877,9 @@ def detect_code_injection_attempt(text: str) -> bool:
     Returns:
         True si injection suspectée
     """
-    # Patterns suspects (non exhaustif, à enrichir selon les besoins)
-    injection_patterns = [
-        r'<script',
-        r'javascript:',
-        r'onclick=',
-        r'onerror=',
-        r'eval\(',
-        r'__import__',
-        r'exec\(',
-    ]
-    
-    text_lower = text.lower()
-    for pattern in injection_patterns:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            logger.warning(f"⚠️ Tentative d'injection détectée: {pattern}")
-            return True
+    injection = _find_injection(text)
+    if injection is not None:
+        logger.warning(f"⚠️ Tentative d'injection détectée: {injection}")
+        return True
     
     return False
\ No newline at end of file
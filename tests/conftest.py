@@ -0,0 +1,9 @@
+"""
+Configuration pytest: rend les modules de l'application (à la racine du
+dépôt) importables depuis les tests.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,212 @@
+"""
+Tests de l'API (app.py), sans chargement du modèle: le lifespan n'est pas
+exécuté, seules la validation et la sérialisation des erreurs sont testées.
+"""
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+
+@pytest.fixture
+def client():
+    return TestClient(app_module.app, raise_server_exceptions=False)
+
+
+@pytest.mark.parametrize("text", ["\ud800", "Prenez \ud800 500 mg"])
+def test_translate_rejects_lone_surrogate(client, text):
+    """Un surrogate isolé dans le JSON donne une erreur 422, pas une 500"""
+    response = client.post(
+        "/translate",
+        json={"text": text, "source_lang": "fra_Latn", "target_lang": "wol_Latn"}
+    )
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "text"]
+
+
+def test_batch_worker_overlaps_language_pairs(monkeypatch):
+    """Deux lots de paires différentes sont en cours simultanément"""
+    import asyncio
+    import threading
+    
+    both_started = threading.Barrier(2, timeout=5)
+    
+    def fake_inference(texts, source_lang, target_lang):
+        # Bloque tant que l'autre lot n'a pas démarré: échoue si sérialisé
+        both_started.wait()
+        return [f"{target_lang}:{text}" for text in texts]
+    
+    monkeypatch.setattr(app_module, "_run_batch_inference", fake_inference)
+    
+    async def scenario():
+        monkeypatch.setattr(app_module, "translation_queue", asyncio.Queue())
+        worker = asyncio.create_task(app_module._batch_worker())
+        try:
+            return await asyncio.gather(
+                app_module._submit_translation("Bonjour", "fra_Latn", "wol_Latn"),
+                app_module._submit_translation("Hello", "eng_Latn", "fra_Latn"),
+            )
+        finally:
+            worker.cancel()
+    
+    assert asyncio.run(scenario()) == ["wol_Latn:Bonjour", "fra_Latn:Hello"]
+
+
+def test_batch_worker_cancel_fails_undispatched_requests(monkeypatch):
+    """À l'arrêt, les lots lancés se terminent, les autres reçoivent une erreur"""
+    import asyncio
+    import threading
+    
+    release = threading.Event()
+    started = threading.Semaphore(0)
+    
+    def fake_inference(texts, source_lang, target_lang):
+        started.release()
+        release.wait(timeout=5)
+        return [f"{target_lang}:{text}" for text in texts]
+    
+    monkeypatch.setattr(app_module, "_run_batch_inference", fake_inference)
+    
+    async def scenario():
+        monkeypatch.setattr(app_module, "translation_queue", asyncio.Queue())
+        worker = asyncio.create_task(app_module._batch_worker())
+        # Trois paires de langues: deux lots lancés, le troisième en attente
+        requests = [
+            asyncio.create_task(app_module._submit_translation(text, src, tgt))
+            for text, src, tgt in [
+                ("Bonjour", "fra_Latn", "wol_Latn"),
+                ("Hello", "eng_Latn", "fra_Latn"),
+                ("Salaam", "wol_Latn", "fra_Latn"),
+            ]
+        ]
+        for _ in range(app_module.MAX_INFLIGHT_BATCHES):
+            await asyncio.to_thread(started.acquire, timeout=5)
+        
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        release.set()
+        await asyncio.gather(*app_module.batch_group_tasks)
+        return await asyncio.wait_for(
+            asyncio.gather(*requests, return_exceptions=True), timeout=5
+        )
+    
+    first, second, third = asyncio.run(scenario())
+    
+    assert first == "wol_Latn:Bonjour"
+    assert second == "fra_Latn:Hello"
+    assert isinstance(third, RuntimeError)
+
+
+def test_batch_worker_returns_each_result_to_its_request(monkeypatch):
+    """Un lot mélangeant plusieurs paires: chaque requête reçoit sa traduction"""
+    import asyncio
+    
+    calls = []
+    
+    def fake_inference(texts, source_lang, target_lang):
+        calls.append((tuple(texts), source_lang, target_lang))
+        return [f"{target_lang}:{text}" for text in texts]
+    
+    monkeypatch.setattr(app_module, "_run_batch_inference", fake_inference)
+    monkeypatch.setattr(app_module, "BATCH_MAX_WAIT_MS", 50)
+    
+    requests = [
+        ("un", "fra_Latn", "wol_Latn"),
+        ("one", "eng_Latn", "fra_Latn"),
+        ("deux", "fra_Latn", "wol_Latn"),
+        ("two", "eng_Latn", "fra_Latn"),
+        ("trois", "fra_Latn", "wol_Latn"),
+    ]
+    
+    async def scenario():
+        monkeypatch.setattr(app_module, "translation_queue", asyncio.Queue())
+        worker = asyncio.create_task(app_module._batch_worker())
+        try:
+            return await asyncio.gather(*(
+                app_module._submit_translation(*request) for request in requests
+            ))
+        finally:
+            worker.cancel()
+    
+    results = asyncio.run(scenario())
+    
+    assert results == [f"{target}:{text}" for text, _, target in requests]
+    # Un seul appel au modèle par paire de langues, textes dans l'ordre d'arrivée
+    assert sorted(calls) == [
+        (("one", "two"), "eng_Latn", "fra_Latn"),
+        (("un", "deux", "trois"), "fra_Latn", "wol_Latn"),
+    ]
+
+
+def test_batch_worker_fails_only_the_group_in_error(monkeypatch):
+    """Une erreur d'inférence échoue les requêtes du lot, pas celles des autres"""
+    import asyncio
+    
+    def fake_inference(texts, source_lang, target_lang):
+        if source_lang == "eng_Latn":
+            raise RuntimeError("CUDA out of memory")
+        return [f"{target_lang}:{text}" for text in texts]
+    
+    monkeypatch.setattr(app_module, "_run_batch_inference", fake_inference)
+    monkeypatch.setattr(app_module, "BATCH_MAX_WAIT_MS", 50)
+    
+    async def scenario():
+        monkeypatch.setattr(app_module, "translation_queue", asyncio.Queue())
+        worker = asyncio.create_task(app_module._batch_worker())
+        try:
+            return await asyncio.gather(
+                app_module._submit_translation("un", "fra_Latn", "wol_Latn"),
+                app_module._submit_translation("one", "eng_Latn", "fra_Latn"),
+                app_module._submit_translation("two", "eng_Latn", "fra_Latn"),
+                return_exceptions=True
+            )
+        finally:
+            worker.cancel()
+    
+    ok, first_error, second_error = asyncio.run(scenario())
+    
+    assert ok == "wol_Latn:un"
+    assert isinstance(first_error, RuntimeError)
+    assert isinstance(second_error, RuntimeError)
+
+
+def test_batch_worker_cancel_fails_requests_being_collected(monkeypatch):
+    """Arrêt pendant la fenêtre de collecte: les requêtes retirées échouent"""
+    import asyncio
+    
+    monkeypatch.setattr(app_module, "BATCH_MAX_WAIT_MS", 10_000)
+    
+    async def scenario():
+        monkeypatch.setattr(app_module, "translation_queue", asyncio.Queue())
+        worker = asyncio.create_task(app_module._batch_worker())
+        request = asyncio.create_task(
+            app_module._submit_translation("Bonjour", "fra_Latn", "wol_Latn")
+        )
+        # Laisser le worker retirer la requête de la file (fenêtre ouverte)
+        await asyncio.sleep(0.05)
+        assert app_module.translation_queue.empty()
+        
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        return await asyncio.wait_for(
+            asyncio.gather(request, return_exceptions=True), timeout=5
+        )
+    
+    (result,) = asyncio.run(scenario())
+    
+    assert isinstance(result, RuntimeError)
+
+
+def test_request_id_uses_current_pid(client, monkeypatch):
+    """Le PID est lu à chaque requête (workers forkés après l'import)"""
+    monkeypatch.setattr(app_module.os, "getpid", lambda: 4242)
+    
+    response = client.get("/")
+    
+    assert response.headers["X-Request-ID"].startswith("4242-")
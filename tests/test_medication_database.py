@@ -0,0 +1,93 @@
+"""
+Tests de la base de médicaments (medication_database.py)
+"""
+
+import pytest
+
+import medication_database
+from medication_database import MedicationDatabase, _fold
+
+
+@pytest.fixture(scope="module")
+def database():
+    return MedicationDatabase()
+
+
+def test_find_medications_accepts_lone_surrogate(database):
+    """Un surrogate isolé (ex: "\\ud800" reçu en JSON) ne fait pas échouer la recherche"""
+    found = database.find_medications("Prendre \ud800 paracétamol et ibuprofène")
+    
+    assert found == ["paracétamol", "ibuprofène"]
+
+
+def test_find_medications_in_long_accented_text(database):
+    """Positions correctes sur un long texte non-ASCII (accents, surrogate, emoji)"""
+    text = ("é" * 30 + " \ud800 🧹 paracétamol ") * 200 + "ibuprofène"
+    
+    found = database.find_medications(text)
+    
+    assert set(found) == {"paracétamol", "ibuprofène"}
+
+
+@pytest.mark.skipif(medication_database.hyperscan is None, reason="hyperscan non installé")
+def test_hyperscan_spans_are_character_offsets(database):
+    """Les positions Hyperscan (en octets) sont converties en caractères"""
+    database.find_medications("")  # compile la base si nécessaire
+    folded = _fold("Élève \ud800 ça: paracétamol puis ibuprofène")
+    
+    matched = {folded[start:end] for start, end in database._spans_with_hyperscan(folded)}
+    
+    assert {"paracetamol", "ibuprofene"} <= matched
+    assert matched <= {_fold(medication) for medication in database.medications}
+
+
+@pytest.fixture(params=["hyperscan", "ahocorasick", "regex"])
+def backend_database(request, monkeypatch):
+    """Base construite avec chaque moteur de recherche disponible"""
+    if request.param in ("ahocorasick", "regex"):
+        monkeypatch.setattr(medication_database, "hyperscan", None)
+    if request.param == "regex":
+        monkeypatch.setattr(medication_database, "ahocorasick", None)
+    if getattr(medication_database, request.param, True) is None:
+        pytest.skip(f"{request.param} non installé")
+    return MedicationDatabase()
+
+
+@pytest.mark.parametrize("text", [
+    "Paracétamol, PARACETAMOL et paracetamol",
+    "ibuprofené ou parâcetamol",
+    "Ibuprofène puis ibuprofene",
+])
+def test_find_medications_agrees_with_medication_pattern(backend_database, text):
+    """Seuls les accents des orthographes indexées sont acceptés, comme le pattern"""
+    expected = [
+        backend_database._canonical_name(match.group())
+        for match in backend_database.medication_pattern.finditer(text)
+    ]
+    
+    assert backend_database.find_medications(text) == expected
+
+
+def test_fold_table_does_not_grow():
+    """La table de normalisation ne grossit pas avec les caractères reçus"""
+    size = len(medication_database._FOLD_TABLE)
+    
+    _fold("Ωμέγα 汉字 \ud800 Ǆ ṩ")
+    
+    assert len(medication_database._FOLD_TABLE) == size
+
+
+@pytest.mark.skipif(medication_database.hyperscan is None, reason="hyperscan non installé")
+def test_find_medications_falls_back_when_scratch_in_use(monkeypatch):
+    """Scan concurrent sur la base partagée: repli sur le pattern regex"""
+    database = MedicationDatabase()
+    text = "Prendre PARACÉTAMOL et Ibuprofène"
+    expected = database.find_medications(text)
+    
+    class BusyDatabase:
+        def scan(self, *args, **kwargs):
+            raise medication_database.hyperscan.ScratchInUseError()
+    
+    monkeypatch.setattr(database, "_hs_db", BusyDatabase())
+    
+    assert database.find_medications(text) == expected == ["paracétamol", "ibuprofène"]
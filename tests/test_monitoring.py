@@ -0,0 +1,125 @@
+"""
+Tests du module de monitoring (monitoring.py)
+"""
+
+import logging
+import time
+
+import pytest
+
+import monitoring
+from monitoring import TranslationMonitor, setup_logging, stop_logging
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """Fichier de log temporaire; handlers du logger racine restaurés ensuite"""
+    path = tmp_path / "audit.log"
+    monkeypatch.setattr(monitoring, "LOG_FILE", str(path))
+    
+    root_logger = logging.getLogger()
+    saved_handlers = root_logger.handlers[:]
+    saved_level = root_logger.level
+    yield path
+    
+    stop_logging()
+    for handler in root_logger.handlers[:]:
+        if handler not in saved_handlers:
+            root_logger.removeHandler(handler)
+            handler.close()
+    root_logger.setLevel(saved_level)
+
+
+# STATISTIQUES DE PERFORMANCE
+
+@pytest.mark.parametrize("times_ms", [[10.0, 30.0], [10.0, 20.0, 30.0], [5.0, 7.5, 12.0, 30.0]])
+def test_percentiles_stay_within_observed_range(times_ms):
+    """Les percentiles ne doivent jamais dépasser le temps maximal observé"""
+    monitor = TranslationMonitor()
+    for i, time_ms in enumerate(times_ms):
+        monitor.log_response(f"req-{i}", success=True, translation_time_ms=time_ms)
+    
+    performance = monitor.get_statistics(include_percentiles=True)["performance"]
+    
+    maximum = performance["max_translation_time_ms"]
+    minimum = performance["min_translation_time_ms"]
+    assert minimum <= performance["p50_translation_time_ms"] <= maximum
+    assert performance["p95_translation_time_ms"] <= maximum
+    assert performance["p99_translation_time_ms"] <= maximum
+
+
+# ARRÊT DU LOGGING
+
+def test_stop_logging_keeps_writing_records_logged_after_stop(log_file):
+    """Après stop_logging, les records vont encore au fichier (plus de file orpheline)"""
+    setup_logging()
+    queue_handler = monitoring._log_queue_handler
+    logger = logging.getLogger("tests.shutdown")
+    logger.info("avant arrêt")
+    
+    stop_logging()
+    logger.info("après arrêt 🧹")
+    
+    root_handlers = logging.getLogger().handlers
+    assert queue_handler not in root_handlers
+    for handler in root_handlers:
+        handler.flush()
+    
+    content = log_file.read_text(encoding="utf-8")
+    assert "avant arrêt" in content
+    assert "après arrêt 🧹" in content
+
+
+# FICHIER DE LOG BUFFERISÉ
+
+def _make_record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("tests", level, __file__, 0, message, None, None)
+
+
+def test_buffered_handler_flushes_after_interval_without_new_records(tmp_path):
+    """Le dernier record INFO est écrit après flush_interval, sans record suivant"""
+    path = tmp_path / "audit.log"
+    handler = monitoring._BufferedRotatingFileHandler(
+        str(path), encoding="utf-8", flush_interval=0.05
+    )
+    try:
+        handler.emit(_make_record("première requête"))
+        handler.emit(_make_record("dernière requête"))
+        
+        deadline = time.monotonic() + 2.0
+        while "dernière requête" not in path.read_text(encoding="utf-8"):
+            assert time.monotonic() < deadline, "record jamais écrit sur disque"
+            time.sleep(0.01)
+    finally:
+        handler.close()
+
+
+def test_buffered_handler_writes_warnings_immediately(tmp_path):
+    """WARNING et plus (rejets de sécurité) sont écrits sans attendre"""
+    path = tmp_path / "audit.log"
+    handler = monitoring._BufferedRotatingFileHandler(
+        str(path), encoding="utf-8", flush_interval=3600
+    )
+    try:
+        handler.emit(_make_record("rejet de sécurité", logging.WARNING))
+        assert "rejet de sécurité" in path.read_text(encoding="utf-8")
+    finally:
+        handler.close()
+
+
+def test_buffered_handler_rotates_on_bytes_not_characters(tmp_path):
+    """La rotation respecte maxBytes en octets, même avec accents et emojis"""
+    path = tmp_path / "audit.log"
+    max_bytes = 1000
+    handler = monitoring._BufferedRotatingFileHandler(
+        str(path), encoding="utf-8", maxBytes=max_bytes, backupCount=3,
+        flush_interval=3600
+    )
+    try:
+        for _ in range(40):
+            handler.emit(_make_record("é" * 20 + "🧹" * 5))
+    finally:
+        handler.close()
+    
+    for log_path in tmp_path.iterdir():
+        assert log_path.stat().st_size <= max_bytes
@@ -0,0 +1,90 @@
+"""
+Tests du module de sécurité (safety.py)
+"""
+
+import pytest
+
+from safety import MedicalSafetyChecker, detect_code_injection_attempt
+
+
+# TEXTES NON ENCODABLES EN UTF-8 (SURROGATE ISOLÉ)
+
+def test_injection_detection_accepts_lone_surrogate():
+    """Un surrogate isolé ne doit pas faire échouer la détection d'injection"""
+    assert detect_code_injection_attempt("Prenez \ud800 eval(1)") is True
+    assert detect_code_injection_attempt("Prenez \ud800 le matin") is False
+
+
+def test_negation_check_accepts_lone_surrogate():
+    """Les négations restent détectées dans un texte avec surrogate isolé"""
+    checker = MedicalSafetyChecker()
+    
+    result = checker.check_negation_preservation(
+        "Ne pas dépasser \ud800 la dose",
+        "Dépasser \ud800 la dose",
+        "fra_Latn"
+    )
+    
+    assert not result.is_safe
+    assert result.error_code == "NEGATION_LOSS"
+
+
+# RESTAURATION DES VALEURS APRÈS TRADUCTION
+
+def test_restore_rechecks_numbers_after_each_patch():
+    """Un nombre retiré par une restauration est lui-même restauré"""
+    checker = MedicalSafetyChecker()
+    
+    assert checker.restore_critical_values_post_translation("1 2 3", "1 3 4") == "1 2 3"
+
+
+def test_restore_rechecks_dosages_after_each_patch():
+    """Même règle pour les posologies: "250 mg" retiré puis restauré"""
+    checker = MedicalSafetyChecker()
+    
+    # L'unité de "100 g" n'est corrigée que par la restauration des posologies
+    restored = checker.restore_critical_values_post_translation(
+        "500 mg puis 250 mg",
+        "250 mg puis 100 g"
+    )
+    
+    assert restored == "500 mg puis 250 mg"
+
+
+# VÉRIFICATION PAR LOT
+
+def test_batch_safety_check_matches_single_calls():
+    """Même résultat, avertissements et ordre compris, qu'appel par appel"""
+    checker = MedicalSafetyChecker()
+    pairs = [
+        ("Prendre 500 mg le matin", "Take 500 mg in the morning", "fra_Latn", None),
+        ("Prendre 500 mg", "Prendre 250 mg", "fra_Latn", None),
+        ("Ne pas dépasser la dose", "Dépasser la dose", "fra_Latn", None),
+        ("Oui", "Oui " + "très " * 20, "fra_Latn", None),
+        ("Prendre paracétamol", "Prendre MEDICATIONA", "fra_Latn",
+         {"MEDICATIONA": "paracétamol"}),
+        ("Oui", "Oui MEDICATIONA " + "x " * 30, "fra_Latn", {"MEDICATIONA": "x"}),
+        ("Prendre 500 mg", "Prendre 500 mg", "fra_Latn", {"DOSAGE0": "500 mg"}),
+    ]
+    sources, translations, langs, maps = (list(column) for column in zip(*pairs))
+    
+    batch = checker.run_full_safety_check_batch(sources, translations, langs, maps)
+    single = [checker.run_full_safety_check(*pair) for pair in pairs]
+    
+    def fields(result):
+        return (result.is_safe, result.error_code, result.error_message, list(result.warnings))
+    
+    assert [fields(result) for result in batch] == [fields(result) for result in single]
+    # Chaque phase du lot est exercée
+    assert {result.error_code for result in single} == {
+        None, "NUMERIC_INTEGRITY_VIOLATION", "NEGATION_LOSS", "PLACEHOLDER_RESIDUE"
+    }
+    assert any(result.is_safe and result.warnings for result in single)
+
+
+def test_batch_safety_check_rejects_mismatched_lengths():
+    """Listes de longueurs différentes: erreur explicite"""
+    checker = MedicalSafetyChecker()
+    
+    with pytest.raises(ValueError):
+        checker.run_full_safety_check_batch(["Bonjour"], [], ["fra_Latn"])